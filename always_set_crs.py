@@ -7,11 +7,21 @@ GeoDataFrame to include additional methods as well as function for
 transforming coordinate reference systems (CRS) using different strategies.
 """
 # Standard library
+import functools
 import typing
 # Third party
 import geopandas as gpd
+import numpy as np
+import pyproj
+import shapely
+try:
+    import cupy as cp
+    import cuproj
+except ImportError:  # cuProj is optional and requires a CUDA capable GPU
+    cuproj = None
 # Constant
 DEFAULT_CRS: str = "EPSG:4087"
+WGS_84_EPSG: int = 4326
 
 
 class MyGeoDataFrame(gpd.GeoDataFrame):
@@ -31,6 +41,7 @@ class MyGeoDataFrame(gpd.GeoDataFrame):
         crs: typing.Union[int, str],
         method: str,
         inplace: bool = True,
+        backend: str = "pyproj"
             ) -> typing.Optional[gpd.GeoDataFrame]:
         """
         Transforms the GeoDataFrame to a specified coordinate reference system
@@ -40,17 +51,78 @@ class MyGeoDataFrame(gpd.GeoDataFrame):
             crs : The target CRS.
             method : The method to use for transformation ('lbyl' or 'eafp').
             inplace : If True, modifies the GeoDataFrame in place.
+            backend : The library to transform with ('pyproj' or 'cuproj').
+                The GPU based cuProj is only used for points between WGS 84
+                and UTM, otherwise pyproj is used.
 
         Returns:
             The transformed GeoDataFrame if inplace is False.
         """
-        match method:
-            case "lbyl":
-                return self._to_crs_lbyl(crs, inplace)
-            case "eafp":
-                return self._to_crs_eafp(crs, inplace)
-            case _:
-                raise ValueError("Method must be either 'lbyl' or 'eafp'.")
+        to_crs_method: typing.Optional[typing.Callable] =\
+            self._METHODS.get(method)
+        if to_crs_method is None:
+            raise ValueError("Method must be either 'lbyl' or 'eafp'.")
+        if backend not in ("pyproj", "cuproj"):
+            raise ValueError("Backend must be either 'pyproj' or 'cuproj'.")
+        if backend == "cuproj" and self._supports_cuproj(crs):
+            return self._to_crs_cuproj(crs, inplace)
+        return to_crs_method(self, crs, inplace)
+
+    def _supports_cuproj(
+        self,
+        crs: typing.Union[int, str]
+            ) -> bool:
+        """
+        Check whether the transformation can be done with cuProj, which only
+        supports a subset of PROJ.
+
+        Parameters:
+            crs : The target CRS.
+
+        Returns:
+            True if cuProj is installed, the geometries are two-dimensional
+            points and the transformation is between WGS 84 and UTM.
+        """
+        if cuproj is None or self.crs is None:
+            return False
+        epsg_codes: typing.Set[typing.Optional[int]] = {
+            self.crs.to_epsg(), pyproj.CRS.from_user_input(crs).to_epsg()}
+        return (WGS_84_EPSG in epsg_codes and
+                any(_is_utm(epsg) for epsg in epsg_codes) and
+                bool((self.geom_type == "Point").all()) and
+                not self.has_z.any())
+
+    def _to_crs_cuproj(
+        self,
+        crs: typing.Union[int, str],
+        inplace: bool
+            ) -> typing.Optional[gpd.GeoDataFrame]:
+        """
+        Transform the point geometries on the GPU with cuProj.
+
+        Parameters:
+            crs : The target CRS.
+            inplace : If True, modifies the GeoDataFrame in place.
+
+        Returns:
+            The transformed GeoDataFrame if inplace is False.
+        """
+        source: int = self.crs.to_epsg()
+        target: int = pyproj.CRS.from_user_input(crs).to_epsg()
+        transformer = cuproj.Transformer.from_crs(f"EPSG:{source}",
+                                                  f"EPSG:{target}")
+        x, y = self.geometry.x.to_numpy(), self.geometry.y.to_numpy()
+        # cuProj uses the axis order of the authority, (lat, lon) for WGS 84
+        first, second = (y, x) if source == WGS_84_EPSG else (x, y)
+        first, second = map(cp.asnumpy, transformer.transform(
+            cp.asarray(first), cp.asarray(second)))
+        new_x, new_y = ((second, first) if target == WGS_84_EPSG
+                        else (first, second))
+        gdf: gpd.GeoDataFrame = self if inplace else self.copy()
+        gdf.geometry = gpd.GeoSeries(gpd.points_from_xy(new_x, new_y),
+                                     index=gdf.index,
+                                     crs=crs)
+        return None if inplace else gdf
 
     def _to_crs_lbyl(
         self,
@@ -69,18 +141,114 @@ class MyGeoDataFrame(gpd.GeoDataFrame):
         """
         if self.crs is None:
             self.set_crs(DEFAULT_CRS, inplace=True)
-        return self.to_crs(crs, inplace=inplace)
+        return _to_crs_cached(self, crs, inplace=inplace)
 
     def _to_crs_eafp(
         self,
         crs: typing.Union[int, str],
         inplace: bool
             ) -> typing.Optional[gpd.GeoDataFrame]:
+        """
+        Transform CRS using the 'Easier to Ask for Forgiveness than
+        Permission' method. A missing CRS raises before any PROJ pipeline is
+        set up, so the retry only creates (or reuses) a single transformer.
+
+        Parameters:
+            crs : The target CRS.
+            inplace : If True, modifies the GeoDataFrame in place.
+
+        Returns:
+            The transformed GeoDataFrame if inplace is False.
+        """
         try:
-            return self.to_crs(crs, inplace=inplace)
+            return _to_crs_cached(self, crs, inplace=inplace)
         except ValueError:
             self.set_crs(DEFAULT_CRS, inplace=True)
-            return self.to_crs(crs, inplace=inplace)
+            return _to_crs_cached(self, crs, inplace=inplace)
+
+    # Mapping of the method names to the (unbound) transformation methods
+    _METHODS: typing.Dict[str, typing.Callable] = {"lbyl": _to_crs_lbyl,
+                                                   "eafp": _to_crs_eafp}
+
+
+def _is_utm(
+    epsg: typing.Optional[int]
+        ) -> bool:
+    """
+    Check whether an EPSG code is one of the WGS 84 / UTM zones.
+
+    Parameters:
+        epsg : The EPSG code.
+
+    Returns:
+        True if the code belongs to a northern (326xx) or southern (327xx) UTM
+        zone.
+    """
+    return epsg is not None and (32601 <= epsg <= 32660 or
+                                 32701 <= epsg <= 32760)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_transformer(
+    source: pyproj.CRS,
+    target: pyproj.CRS
+        ) -> pyproj.Transformer:
+    """
+    Create a transformer between two CRS's once and reuse it afterwards, as
+    setting up the PROJ pipeline is far more expensive than the transformation.
+
+    Parameters:
+        source : The CRS to transform from.
+        target : The CRS to transform to.
+
+    Returns:
+        The (cached) transformer.
+    """
+    return pyproj.Transformer.from_crs(source, target, always_xy=True)
+
+
+def _to_crs_cached(
+    gdf: gpd.GeoDataFrame,
+    crs: typing.Union[int, str],
+    inplace: bool = False
+        ) -> typing.Optional[gpd.GeoDataFrame]:
+    """
+    Transform a GeoDataFrame to a specified CRS with a cached transformer.
+
+    Parameters:
+        gdf : The GeoDataFrame to transform.
+        crs : The target CRS.
+        inplace : If True, modifies the GeoDataFrame in place.
+
+    Returns:
+        The transformed GeoDataFrame if inplace is False.
+
+    Raises:
+        ValueError: If the GeoDataFrame has no CRS.
+    """
+    if gdf.crs is None:
+        raise ValueError("Cannot transform naive geometries. Please set a crs "
+                         "on the object first.")
+    target: pyproj.CRS = pyproj.CRS.from_user_input(crs)
+    transformer: pyproj.Transformer = _get_transformer(gdf.crs, target)
+
+    def _transform_coordinates(coords: np.ndarray) -> np.ndarray:
+        # Transform the x and y, and the z if the coordinates have them
+        return np.column_stack(transformer.transform(*coords.T))
+
+    geometries: np.ndarray = gdf.geometry.to_numpy()
+    # Transform the geometries with a z coordinate separately, so the z is
+    # transformed and kept like GeoDataFrame.to_crs does
+    has_z: np.ndarray = shapely.has_z(geometries)
+    transformed: np.ndarray = geometries.copy()
+    transformed[~has_z] = shapely.transform(geometries[~has_z],
+                                            _transform_coordinates)
+    transformed[has_z] = shapely.transform(geometries[has_z],
+                                           _transform_coordinates,
+                                           include_z=True)
+    result: gpd.GeoDataFrame = gdf if inplace else gdf.copy()
+    result.geometry = gpd.GeoSeries(transformed, index=gdf.index, crs=target)
+    return None if inplace else result
 
 
 def to_crs_lbyl(
@@ -100,7 +268,7 @@ def to_crs_lbyl(
     """
     if gdf.crs is None:
         gdf.set_crs(DEFAULT_CRS, inplace=True)
-    return gdf.to_crs(crs)
+    return _to_crs_cached(gdf, crs)
 
 
 def to_crs_eafp(
@@ -119,9 +287,9 @@ def to_crs_eafp(
         The transformed GeoDataFrame.
     """
     try:
-        return gdf.to_crs(crs)
+        return _to_crs_cached(gdf, crs)
     except ValueError:
-        return gdf.set_crs(DEFAULT_CRS).to_crs(crs)
+        return _to_crs_cached(gdf.set_crs(DEFAULT_CRS), crs)
 
 
 def demo() -> None:
@@ -131,23 +299,22 @@ def demo() -> None:
     """
     import itertools
 
-    def _create_geodataframe() -> gpd.GeoDataFrame:
-        return gpd.GeoDataFrame(geometry=gpd.points_from_xy([10], [10]))
-
     WGS_84_int: int = 4326
     WGS_84_str: str = "4326"
-    demo_gdf: gpd.GeoDataFrame = _create_geodataframe()
+    # Create the (immutable) point geometries once with the vectorized API
+    points: np.ndarray = shapely.points(np.array([10.0]), np.array([10.0]))
+    demo_gdf: gpd.GeoDataFrame = gpd.GeoDataFrame(geometry=points)
     print(f"{demo_gdf.crs=}")
     for func, crs in itertools.product([to_crs_lbyl, to_crs_eafp],
                                        [WGS_84_int, WGS_84_str]):
         if func(demo_gdf, crs).crs == crs:
             print(f"{func.__name__} worked with {crs=}")
 
+    base_gdf: MyGeoDataFrame = MyGeoDataFrame(geometry=points)
     for method, crs, in_place in itertools.product(["lbyl", "eafp"],
                                                    [WGS_84_int, WGS_84_str],
                                                    [True, False]):
-        new_gdf: gpd.GeoDataFrame = MyGeoDataFrame(
-            geometry=gpd.points_from_xy([10], [10]))
+        new_gdf: gpd.GeoDataFrame = base_gdf.copy()
         other_gdf: typing.Optional[gpd.GeoDataFrame] =\
             new_gdf.always_to_crs(crs, method, in_place)
         if [gdf for gdf in [other_gdf, new_gdf]
@@ -8,12 +8,16 @@ functions to handle zip files, perform benchmarks, and visualize the results
 using matplotlib.
 """
 # Standard library
+import collections
+import contextlib
+import mmap
 import pathlib
 import timeit
+import tracemalloc
 import typing
 # Third party
 import matplotlib.pyplot as plt
-import memory_profiler
+import numpy as np
 # Local imports
 import lazy_zipfile
 import lazy_zipfile_v2
@@ -24,11 +28,15 @@ FILE_SMALL: str = "fig1.png"
 TEST_FILE_LARGE: pathlib.WindowsPath =\
     pathlib.Path("C:/Users/joost/code/test_big.zip")
 FILE_LARGE: str = "Git-2.47.0.2-64-bit.exe"
+MEBIBYTE: int = 1024 ** 2
 
 
 def handle_small_1() -> None:
     """Read the contents of a small zip file using lazy_zipfile."""
-    next(lazy_zipfile.lazy_read_zip_file_contents(TEST_FILE_SMALL)[FILE_SMALL])
+    # Consume the chunks without keeping them
+    collections.deque(
+        lazy_zipfile.lazy_read_zip_file_contents(TEST_FILE_SMALL)[FILE_SMALL],
+        maxlen=0)
 
 
 def handle_small_2() -> None:
@@ -36,61 +44,111 @@ def handle_small_2() -> None:
     lazy_zipfile_v2.lazy_read_zip_file_contents(TEST_FILE_SMALL)[FILE_SMALL]
 
 
+class _MappedFile(mmap.mmap):
+    """
+    Read-only memory map that can be used as a file object by zipfile, which
+    requires seekable() that mmap only provides as of Python 3.13.
+    """
+
+    def seekable(self) -> bool:
+        """Memory maps are always seekable."""
+        return True
+
+
+@contextlib.contextmanager
+def _memory_map(
+    path: pathlib.Path
+        ) -> typing.Iterator[_MappedFile]:
+    """
+    Map a whole file into memory as a single read-only region, so only the
+    pages that are touched (central directory and the requested file) are
+    read from disk.
+
+    Parameters:
+        path: The path to the file to map.
+
+    Yields:
+        The memory-mapped file.
+    """
+    with (open(path, "rb") as file,
+          _MappedFile(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped):
+        yield mapped
+
+
 def handle_large_1() -> None:
     """Read the contents of a large zip file using lazy_zipfile."""
-    next(lazy_zipfile.lazy_read_zip_file_contents(TEST_FILE_LARGE)[FILE_LARGE])
+    with _memory_map(TEST_FILE_LARGE) as archive:
+        collections.deque(
+            lazy_zipfile.lazy_read_zip_file_contents(archive)[FILE_LARGE],
+            maxlen=0)
 
 
 def handle_large_2() -> None:
     """Read the contents of a large zip file using lazy_zipfile_v2."""
-    lazy_zipfile_v2.lazy_read_zip_file_contents(TEST_FILE_LARGE)[FILE_LARGE]
+    with _memory_map(TEST_FILE_LARGE) as archive:
+        lazy_zipfile_v2.lazy_read_zip_file_contents(archive)[FILE_LARGE]
 
 
 def benchmark_time(
-    iterations: int = 1
+    iterations: int = 1,
+    repeat: int = 5
         ) -> typing.Tuple[float]:
     """
     Benchmark the time taken to read small and large zip files.
 
     Parameters:
         iterations: The number of iterations for the benchmark.
+        repeat: The number of times the benchmark is repeated, the fastest
+            run is kept to reduce the noise.
 
     Returns:
         Time taken for small and large zip files using both lazy loading
         implementations.
     """
-    result1_small: float = timeit.timeit(
-        "handle_small_1()", globals=globals(), number=iterations)
-    result2_small: float = timeit.timeit(
-        "handle_small_2()", globals=globals(), number=iterations)
-    result1_small: float = timeit.timeit(
-        "handle_large_1()", globals=globals(), number=iterations)
-    result2_large: float = timeit.timeit(
-        "handle_large_2()", globals=globals(), number=iterations)
-    return result1_small, result2_small, result1_small, result2_large
-
-
-def benchmark_memory(
-    interval: float
-        ) -> typing.Tuple[typing.List[float]]:
+    def _time(statement: str) -> float:
+        return min(timeit.repeat(statement, globals=globals(),
+                                 number=iterations, repeat=repeat))
+
+    result1_small: float = _time("handle_small_1()")
+    result2_small: float = _time("handle_small_2()")
+    result1_large: float = _time("handle_large_1()")
+    result2_large: float = _time("handle_large_2()")
+    return result1_small, result2_small, result1_large, result2_large
+
+
+def _trace_memory(
+    handler: typing.Callable[[], None]
+        ) -> float:
     """
-    Benchmark the memory usage of reading small and large zip files.
+    Trace the memory allocated while running a handler.
 
     Parameters:
-        interval: The interval for memory profiling.
+        handler: The function to trace.
 
     Returns:
-        Memory usage for small and large zip files using both lazy loading
-        implementations.
+        The peak traced memory in MiB.
+    """
+    tracemalloc.start()
+    try:
+        handler()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / MEBIBYTE
+
+
+def benchmark_memory() -> typing.Tuple[float]:
+    """
+    Benchmark the memory usage of reading small and large zip files.
+
+    Returns:
+        Peak memory usage for small and large zip files using both lazy
+        loading implementations.
     """
-    memory_used1_small: typing.List[float] = memory_profiler.memory_usage(
-        (handle_small_1), interval=interval)
-    memory_used1_large: typing.List[float] = memory_profiler.memory_usage(
-        (handle_large_1), interval=interval)
-    memory_used2_small: typing.List[float] = memory_profiler.memory_usage(
-        (handle_small_2), interval=interval)
-    memory_used2_large: typing.List[float] = memory_profiler.memory_usage(
-        (handle_large_2), interval=interval)
+    memory_used1_small: float = _trace_memory(handle_small_1)
+    memory_used1_large: float = _trace_memory(handle_large_1)
+    memory_used2_small: float = _trace_memory(handle_small_2)
+    memory_used2_large: float = _trace_memory(handle_large_2)
     return (memory_used1_small, memory_used1_large,
             memory_used2_small, memory_used2_large)
 
@@ -105,24 +163,25 @@ def main() -> None:
     Returns:
         None
     """
-    timed_results = []
-    for it in [1, 10, 100, 1_000]:
-        print(it, step := benchmark_time(it))
-        timed_results.append(step)
-    sized_results = benchmark_memory(.01)
+    iterations: typing.List[int] = [1, 10, 100, 1_000]
+    # Columns: small_1, small_2, large_1 and large_2
+    timed_results: np.ndarray = np.empty((len(iterations), 4))
+    for row, it in enumerate(iterations):
+        timed_results[row] = benchmark_time(it)
+        print(it, timed_results[row])
+    sized_results = benchmark_memory()
     _, axes = plt.subplots(nrows=2)
-    x1, y1, x2, y2 = list(zip(*timed_results))
-    axes[0].scatter(x1, y2, color="green", label="small")
-    axes[0].scatter(x2, y2, color="red", label="large")
-    axes[0].set_xlim([0, max([max(x1), max(x2)]) + 1])
-    axes[0].set_ylim([0, max([max(y1), max(y2)]) + 1])
-    for res, color, name in zip(sized_results,
-                                ["#003f5c", "#58508d", "#bc5090", "#ff6361"],
-                                ["small_1", "large_1", "small_2", "large_2"]):
-        axes[1].plot(res, color=color, label=name)
-    axes[1].legend(loc="upper left", ncols=2)
-    axes[1].set_xlim([0, len(sized_results[0])])
-    axes[1].set_ylim([0, max(map(max, sized_results)) + 50])
+    # Plot the first implementation (x) against the second implementation (y)
+    axes[0].scatter(timed_results[:, 0], timed_results[:, 1],
+                    color="green", label="small")
+    axes[0].scatter(timed_results[:, 2], timed_results[:, 3],
+                    color="red", label="large")
+    axes[0].set_xlim([0, timed_results[:, [0, 2]].max() + 1])
+    axes[0].set_ylim([0, timed_results[:, [1, 3]].max() + 1])
+    # Plot the peak memory of every implementation and file as a bar
+    axes[1].bar(["small_1", "large_1", "small_2", "large_2"], sized_results,
+                color=["#003f5c", "#58508d", "#bc5090", "#ff6361"])
+    axes[1].set_ylabel("Peak traced memory (MiB)")
     plt.show(block=True)
 
 
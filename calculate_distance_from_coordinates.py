@@ -7,20 +7,44 @@ points on Earth using various formulas, including Haversine, Vincenty, and the
 Law of Cosines.
 
 It supports distance calculations in kilometers and miles, and includes utility
-functions for converting coordinates from degrees to radians.
+functions for converting coordinates from degrees to radians. All functions
+accept either scalar coordinates or array-like coordinates, the latter are
+computed with vectorized NumPy functions.
 
 Functions:
 - calculate_haversine_distance: Computes distance using the Haversine formula.
 - calculate_vincenty_distance: Computes distance using the Vincenty formula.
 - calculate_law_of_cosines_distance: Computes distance using the Law of
 Cosines.
+- calculate_distance_batch: Computes the distances for many pairs of points,
+compiled with Numba when it is installed.
+- calculate_distance_matrix: Computes the distances between all pairs of two
+sets of points.
+- DISTANCE_UFUNCS: NumPy ufuncs of the formulas (only with Numba installed),
+compiled on first use.
 """
 # Standard library
+import collections.abc
 import enum
 import math
 import typing
+# Third party
+import numpy as np
+try:
+    import numba
+except ImportError:  # Numba is optional, NumPy is used as a fallback
+    numba = None
 # Constants
 RADIUS_EARTH: float = 6371.0088
+FLATTENING_EARTH: float = 1 / 298.257223563
+_MI_PER_KM: float = 0.621371192
+_RADIUS_KM: float = RADIUS_EARTH
+_RADIUS_MI: float = _MI_PER_KM * RADIUS_EARTH
+_ONE_MINUS_FLATTENING: float = 1 - FLATTENING_EARTH
+_DEGREES_TO_RADIANS: float = math.pi / 180
+# Type alias for scalar or array-like coordinates
+Coordinate = typing.Union[float, np.ndarray]
+_prange: typing.Callable = range if numba is None else numba.prange
 
 
 class DistanceUnit(str, enum.Enum):
@@ -28,33 +52,54 @@ class DistanceUnit(str, enum.Enum):
     MILES = "mi"
 
 
-CONVERSIONS: typing.Dict[DistanceUnit, float] = {
-    DistanceUnit.KM: RADIUS_EARTH,
-    DistanceUnit.MILES: 0.621371192 * RADIUS_EARTH
-}
+def _is_scalar(
+    *coords: Coordinate
+        ) -> bool:
+    """
+    Check whether all the coordinates are scalars.
+
+    Parameters:
+        coords : The coordinates to check.
+
+    Returns:
+        True if all coordinates are scalars, False otherwise.
+    """
+    return all(np.isscalar(coord) for coord in coords)
 
 
 def _get_earth_radius(
-    unit: DistanceUnit
-            ) -> float:
-    """'
+    unit: typing.Union[str, DistanceUnit],
+    radius: typing.Optional[float] = None
+        ) -> float:
+    """
     Get the Earth's radius based on the specified distance unit.
 
     Parameters:
         unit : The distance unit (KM or MILES).
+        radius : The radius of the Earth in kilometers (default is
+            RADIUS_EARTH).
 
     Returns:
         The radius of the Earth in the specified unit.
+
+    Raises:
+        ValueError: If the unit is not supported.
     """
-    return CONVERSIONS.get(unit)
+    if unit == DistanceUnit.KM:
+        return _RADIUS_KM if radius is None else radius
+    if unit == DistanceUnit.MILES:
+        return _RADIUS_MI if radius is None else _MI_PER_KM * radius
+    units: str = ", ".join(repr(member.value) for member in DistanceUnit)
+    raise ValueError(f"Unit must be one of {units}.")
 
 
 def _convert_to_radians(
-    lat1: float,
-    lon1: float,
-    lat2: float,
-    lon2: float,
-        ) -> map:
+    lat1: Coordinate,
+    lon1: Coordinate,
+    lat2: Coordinate,
+    lon2: Coordinate,
+        ) -> typing.Union[typing.Tuple[float, float, float, float],
+                          np.ndarray]:
     """
     Convert latitude and longitude from degrees to radians.
 
@@ -65,17 +110,21 @@ def _convert_to_radians(
         lon2 : Longitude of the second point.
 
     Returns:
-        Map object with the coordinates in radians.
+        Tuple with the coordinates in radians for scalar input, otherwise an
+        array with the four (broadcasted) coordinate arrays in radians.
     """
-    return map(math.radians, [lat1, lon1, lat2, lon2])
+    if _is_scalar(lat1, lon1, lat2, lon2):
+        return (lat1 * _DEGREES_TO_RADIANS, lon1 * _DEGREES_TO_RADIANS,
+                lat2 * _DEGREES_TO_RADIANS, lon2 * _DEGREES_TO_RADIANS)
+    return np.radians(np.stack(np.broadcast_arrays(lat1, lon1, lat2, lon2)))
 
 
 def _calculate_haversine_component(
-    lat1: float,
-    lon1: float,
-    lat2: float,
-    lon2: float
-        ) -> float:
+    lat1: Coordinate,
+    lon1: Coordinate,
+    lat2: Coordinate,
+    lon2: Coordinate
+        ) -> Coordinate:
     """
     Calculate the Haversine component for distance calculation.
     Formula:
@@ -95,17 +144,27 @@ def _calculate_haversine_component(
     # Calculate the difference between the two coordinates
     delta_lat: float = lat2_rad - lat1_rad
     delta_lon: float = lon2_rad - lon1_rad
-    return (math.sin(delta_lat/2)**2 +
-            math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon/2)**2)
+    if _is_scalar(lat1, lon1, lat2, lon2):
+        sin_half_delta_lat: float = math.sin(delta_lat * 0.5)
+        sin_half_delta_lon: float = math.sin(delta_lon * 0.5)
+        return (sin_half_delta_lat * sin_half_delta_lat +
+                math.cos(lat1_rad) * math.cos(lat2_rad) *
+                sin_half_delta_lon * sin_half_delta_lon)
+    sin_half_delta_lat: np.ndarray = np.sin(delta_lat * 0.5)
+    sin_half_delta_lon: np.ndarray = np.sin(delta_lon * 0.5)
+    return (sin_half_delta_lat * sin_half_delta_lat +
+            np.cos(lat1_rad) * np.cos(lat2_rad) *
+            sin_half_delta_lon * sin_half_delta_lon)
 
 
 def calculate_haversine_distance(
-    lat1: float,
-    lon1: float,
-    lat2: float,
-    lon2: float,
-    unit: typing.Union[str, DistanceUnit] = DistanceUnit.KM
-        ) -> float:
+    lat1: Coordinate,
+    lon1: Coordinate,
+    lat2: Coordinate,
+    lon2: Coordinate,
+    unit: typing.Union[str, DistanceUnit] = DistanceUnit.KM,
+    radius: typing.Optional[float] = None
+        ) -> Coordinate:
     """
     Calculate the distance between two points on the Earth using the Haversine
     formula. This formula calculates the distance between two points on the
@@ -121,23 +180,30 @@ def calculate_haversine_distance(
         lat2 : Latitude of the second point.
         lon2 : Longitude of the second point.
         unit : The unit of distance (default is kilometers).
+        radius : The radius of the Earth in kilometers (default is
+            RADIUS_EARTH).
 
     Returns:
         The distance between the two points in the specified unit.
+
+    Raises:
+        ValueError: If the unit is not supported.
     """
-    radius: float = _get_earth_radius(unit)
-    distance: float = 2 * radius * math.asin(math.sqrt(
-        _calculate_haversine_component(lat1, lon1, lat2, lon2)))
-    return distance
+    radius: float = _get_earth_radius(unit, radius)
+    a = _calculate_haversine_component(lat1, lon1, lat2, lon2)
+    if _is_scalar(lat1, lon1, lat2, lon2):
+        return 2 * radius * math.asin(math.sqrt(a))
+    return 2 * radius * np.arcsin(np.sqrt(a))
 
 
 def calculate_vincenty_distance(
-    lat1: float,
-    lon1: float,
-    lat2: float,
-    lon2: float,
-    unit: typing.Union[str, DistanceUnit] = DistanceUnit.KM
-        ) -> float:
+    lat1: Coordinate,
+    lon1: Coordinate,
+    lat2: Coordinate,
+    lon2: Coordinate,
+    unit: typing.Union[str, DistanceUnit] = DistanceUnit.KM,
+    radius: typing.Optional[float] = None
+        ) -> Coordinate:
     """
     Calculate the distance between two points on the Earth using the Vincenty
     formula.  This formula calculates the distance between two points on the
@@ -155,25 +221,34 @@ def calculate_vincenty_distance(
         lat2 : Latitude of the second point.
         lon2 : Longitude of the second point.
         unit : The unit of distance (default is kilometers).
+        radius : The radius of the Earth in kilometers (default is
+            RADIUS_EARTH).
 
     Returns:
         The distance between the two points in the specified unit.
+
+    Raises:
+        ValueError: If the unit is not supported.
     """
-    radius: float = _get_earth_radius(unit)
+    radius: float = _get_earth_radius(unit, radius)
     a = _calculate_haversine_component(lat1, lon1, lat2, lon2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    if _is_scalar(lat1, lon1, lat2, lon2):
+        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    else:
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
     # semi-minor axis of the Earth's ellipsoid
-    b = (1 - (1 / 298.257223563)) * radius
+    b = _ONE_MINUS_FLATTENING * radius
     return c * b
 
 
 def calculate_law_of_cosines_distance(
-    lat1: float,
-    lon1: float,
-    lat2: float,
-    lon2: float,
-    unit: typing.Union[str, DistanceUnit] = DistanceUnit.KM
-        ) -> float:
+    lat1: Coordinate,
+    lon1: Coordinate,
+    lat2: Coordinate,
+    lon2: Coordinate,
+    unit: typing.Union[str, DistanceUnit] = DistanceUnit.KM,
+    radius: typing.Optional[float] = None
+        ) -> Coordinate:
     """
     Calculate the distance using the Law of Cosines. This formula calculates
     the distance between two points on the surface of a sphere.
@@ -187,16 +262,306 @@ def calculate_law_of_cosines_distance(
         lat2 : Latitude of the second point.
         lon2 : Longitude of the second point.
         unit : The unit of distance (default is kilometers).
+        radius : The radius of the Earth in kilometers (default is
+            RADIUS_EARTH).
 
     Returns:
         float: The distance between the two points in the specified unit.
+
+    Raises:
+        ValueError: If the unit is not supported.
     """
-    radius: float = _get_earth_radius(unit)
+    radius: float = _get_earth_radius(unit, radius)
     lat1_rad, lon1_rad, lat2_rad, lon2_rad =\
         _convert_to_radians(lat1, lon1, lat2, lon2)
-    return math.acos(math.sin(lat1_rad) * math.sin(lat2_rad) +
-                     math.cos(lat1_rad) * math.cos(lat2_rad) *
-                     math.cos(lon2_rad - lon1_rad))*radius
+    if _is_scalar(lat1, lon1, lat2, lon2):
+        return math.acos(math.sin(lat1_rad) * math.sin(lat2_rad) +
+                         math.cos(lat1_rad) * math.cos(lat2_rad) *
+                         math.cos(lon2_rad - lon1_rad))*radius
+    # Clip to guard against rounding errors just outside of acos' domain
+    return np.arccos(np.clip(np.sin(lat1_rad) * np.sin(lat2_rad) +
+                             np.cos(lat1_rad) * np.cos(lat2_rad) *
+                             np.cos(lon2_rad - lon1_rad), -1, 1))*radius
+
+
+def _jit(
+    func: typing.Callable,
+    **options: typing.Any
+        ) -> typing.Callable:
+    """
+    Compile a function with Numba if it is installed.
+
+    Parameters:
+        func : The function to compile.
+        options : The options passed on to numba.njit.
+
+    Returns:
+        The compiled function, or the original function without Numba.
+    """
+    if numba is None:
+        return func
+    return numba.njit(**options)(func)
+
+
+def _haversine_kernel(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+    radius: float
+        ) -> float:
+    """
+    Calculate the Haversine distance for a single pair of points in degrees.
+    """
+    lat1_rad, lon1_rad = math.radians(lat1), math.radians(lon1)
+    lat2_rad, lon2_rad = math.radians(lat2), math.radians(lon2)
+    sin_half_delta_lat = math.sin((lat2_rad - lat1_rad) * 0.5)
+    sin_half_delta_lon = math.sin((lon2_rad - lon1_rad) * 0.5)
+    a = (sin_half_delta_lat * sin_half_delta_lat +
+         math.cos(lat1_rad) * math.cos(lat2_rad) *
+         sin_half_delta_lon * sin_half_delta_lon)
+    return 2 * radius * math.asin(math.sqrt(a))
+
+
+def _vincenty_kernel(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+    radius: float
+        ) -> float:
+    """
+    Calculate the Vincenty distance for a single pair of points in degrees.
+    """
+    lat1_rad, lon1_rad = math.radians(lat1), math.radians(lon1)
+    lat2_rad, lon2_rad = math.radians(lat2), math.radians(lon2)
+    sin_half_delta_lat = math.sin((lat2_rad - lat1_rad) * 0.5)
+    sin_half_delta_lon = math.sin((lon2_rad - lon1_rad) * 0.5)
+    a = (sin_half_delta_lat * sin_half_delta_lat +
+         math.cos(lat1_rad) * math.cos(lat2_rad) *
+         sin_half_delta_lon * sin_half_delta_lon)
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    return c * _ONE_MINUS_FLATTENING * radius
+
+
+def _law_of_cosines_kernel(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+    radius: float
+        ) -> float:
+    """
+    Calculate the Law of Cosines distance for a single pair of points in
+    degrees.
+    """
+    lat1_rad, lon1_rad = math.radians(lat1), math.radians(lon1)
+    lat2_rad, lon2_rad = math.radians(lat2), math.radians(lon2)
+    cos_angle = (math.sin(lat1_rad) * math.sin(lat2_rad) +
+                 math.cos(lat1_rad) * math.cos(lat2_rad) *
+                 math.cos(lon2_rad - lon1_rad))
+    return math.acos(min(max(cos_angle, -1.0), 1.0)) * radius
+
+
+def _make_batch_kernel(
+    kernel: typing.Callable[[float, float, float, float, float], float]
+        ) -> typing.Callable:
+    """
+    Create a (parallel) loop that applies a distance kernel to every pair of
+    points.
+
+    Parameters:
+        kernel : The distance kernel for a single pair of points.
+
+    Returns:
+        The compiled batch function writing the distances into 'out'.
+    """
+    def _batch_kernel(lat1, lon1, lat2, lon2, out, radius):
+        for i in _prange(out.shape[0]):
+            out[i] = kernel(lat1[i], lon1[i], lat2[i], lon2[i], radius)
+    return _jit(_batch_kernel, parallel=True)
+
+
+def _make_ufunc(
+    kernel: typing.Callable[[float, float, float, float, float], float]
+        ) -> typing.Optional[np.ufunc]:
+    """
+    Create a NumPy ufunc from a distance kernel, which supports broadcasting
+    and runs the SIMD vectorized loop on multiple threads.
+
+    Parameters:
+        kernel : The compiled distance kernel for a single pair of points.
+
+    Returns:
+        The ufunc taking (lat1, lon1, lat2, lon2, radius), or None without
+        Numba.
+    """
+    if numba is None:
+        return None
+
+    def _ufunc(lat1, lon1, lat2, lon2, radius):
+        return kernel(lat1, lon1, lat2, lon2, radius)
+    return numba.vectorize(
+        ["float64(float64, float64, float64, float64, float64)"],
+        target="parallel")(_ufunc)
+
+
+class _LazyUfuncs(collections.abc.Mapping):
+    """
+    A read-only mapping of the formula names to their ufuncs, which compiles
+    a ufunc on first use instead of on import, as compiling takes seconds.
+    """
+
+    def __init__(
+        self,
+        kernels: typing.Dict[str, typing.Callable]
+            ) -> None:
+        self._kernels: typing.Dict[str, typing.Callable] = kernels
+        self._ufuncs: typing.Dict[str, typing.Optional[np.ufunc]] = {}
+
+    def __getitem__(self, formula: str) -> typing.Optional[np.ufunc]:
+        """
+        Retrieve the ufunc of a formula, compiling it the first time.
+
+        Parameters:
+            formula : The name of the formula.
+
+        Returns:
+            The ufunc taking (lat1, lon1, lat2, lon2, radius), or None without
+            Numba.
+        """
+        if formula not in self._ufuncs:
+            self._ufuncs[formula] = _make_ufunc(self._kernels[formula])
+        return self._ufuncs[formula]
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._kernels)
+
+    def __len__(self) -> int:
+        return len(self._kernels)
+
+
+_JIT_OPTIONS: typing.Dict[str, bool] = {"fastmath": True,
+                                        "cache": True,
+                                        "boundscheck": False}
+_haversine_kernel = _jit(_haversine_kernel, **_JIT_OPTIONS)
+_vincenty_kernel = _jit(_vincenty_kernel, **_JIT_OPTIONS)
+_law_of_cosines_kernel = _jit(_law_of_cosines_kernel, **_JIT_OPTIONS)
+BATCH_KERNELS: typing.Dict[str, typing.Callable] = {
+    "haversine": _make_batch_kernel(_haversine_kernel),
+    "vincenty": _make_batch_kernel(_vincenty_kernel),
+    "law_of_cosines": _make_batch_kernel(_law_of_cosines_kernel)
+}
+DISTANCE_UFUNCS: typing.Mapping[str, typing.Optional[np.ufunc]] = _LazyUfuncs({
+    "haversine": _haversine_kernel,
+    "vincenty": _vincenty_kernel,
+    "law_of_cosines": _law_of_cosines_kernel
+})
+DISTANCE_FUNCTIONS: typing.Dict[str, typing.Callable] = {
+    "haversine": calculate_haversine_distance,
+    "vincenty": calculate_vincenty_distance,
+    "law_of_cosines": calculate_law_of_cosines_distance
+}
+
+
+def calculate_distance_batch(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+    formula: str = "haversine",
+    unit: typing.Union[str, DistanceUnit] = DistanceUnit.KM
+        ) -> np.ndarray:
+    """
+    Calculate the distances between many pairs of points at once. With Numba
+    installed the loop is compiled and run in parallel, otherwise the
+    vectorized NumPy implementation is used.
+
+    Parameters:
+        lat1 : Latitudes of the first points.
+        lon1 : Longitudes of the first points.
+        lat2 : Latitudes of the second points.
+        lon2 : Longitudes of the second points.
+        formula : The formula to use ('haversine', 'vincenty' or
+            'law_of_cosines').
+        unit : The unit of distance (default is kilometers).
+
+    Returns:
+        The distances between the pairs of points in the specified unit, in
+        the broadcasted shape of the coordinates.
+
+    Raises:
+        ValueError: If the formula or the unit is not supported.
+    """
+    if formula not in BATCH_KERNELS:
+        raise ValueError(
+            f"Formula must be one of {', '.join(map(repr, BATCH_KERNELS))}.")
+    arrays: typing.List[np.ndarray] = np.broadcast_arrays(
+        *(np.asarray(coord, dtype=np.float64)
+          for coord in (lat1, lon1, lat2, lon2)))
+    # Flatten the coordinates for the loop and restore their shape afterwards
+    shape: typing.Tuple[int, ...] = arrays[0].shape
+    coords: np.ndarray = np.stack([array.ravel() for array in arrays])
+    if numba is None:
+        return DISTANCE_FUNCTIONS[formula](*coords, unit=unit).reshape(shape)
+    out: np.ndarray = np.empty(coords.shape[1], dtype=np.float64)
+    BATCH_KERNELS[formula](*coords, out, _get_earth_radius(unit))
+    return out.reshape(shape)
+
+
+def calculate_distance_matrix(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+    formula: str = "haversine",
+    unit: typing.Union[str, DistanceUnit] = DistanceUnit.KM
+        ) -> np.ndarray:
+    """
+    Calculate the distances between every point of the first set and every
+    point of the second set. The sine and cosine of the latitudes are computed
+    once per point, O(M+N), and broadcasted over the M×N pairs.
+
+    Parameters:
+        lat1 : Latitudes of the first (M) points.
+        lon1 : Longitudes of the first (M) points.
+        lat2 : Latitudes of the second (N) points.
+        lon2 : Longitudes of the second (N) points.
+        formula : The formula to use ('haversine', 'vincenty' or
+            'law_of_cosines').
+        unit : The unit of distance (default is kilometers).
+
+    Returns:
+        An M×N matrix with the distances in the specified unit.
+
+    Raises:
+        ValueError: If the formula or the unit is not supported.
+    """
+    if formula not in DISTANCE_FUNCTIONS:
+        formulas: str = ", ".join(map(repr, DISTANCE_FUNCTIONS))
+        raise ValueError(f"Formula must be one of {formulas}.")
+    radius: float = _get_earth_radius(unit)
+    lat1_rad, lon1_rad, lat2_rad, lon2_rad = (
+        np.radians(np.asarray(coord, dtype=np.float64).ravel())
+        for coord in (lat1, lon1, lat2, lon2))
+    cos_lat1: np.ndarray = np.cos(lat1_rad)[:, None]
+    cos_lat2: np.ndarray = np.cos(lat2_rad)[None, :]
+    delta_lon: np.ndarray = lon2_rad[None, :] - lon1_rad[:, None]
+    if formula == "law_of_cosines":
+        cos_angle: np.ndarray = (
+            np.sin(lat1_rad)[:, None] * np.sin(lat2_rad)[None, :] +
+            cos_lat1 * cos_lat2 * np.cos(delta_lon))
+        return np.arccos(np.clip(cos_angle, -1, 1)) * radius
+    sin_half_delta_lat: np.ndarray = np.sin(
+        (lat2_rad[None, :] - lat1_rad[:, None]) * 0.5)
+    sin_half_delta_lon: np.ndarray = np.sin(delta_lon * 0.5)
+    a: np.ndarray = (sin_half_delta_lat * sin_half_delta_lat +
+                     cos_lat1 * cos_lat2 *
+                     sin_half_delta_lon * sin_half_delta_lon)
+    if formula == "haversine":
+        return 2 * radius * np.arcsin(np.sqrt(a))
+    c: np.ndarray = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
+    return c * _ONE_MINUS_FLATTENING * radius
 
 
 def demo() -> None:
@@ -238,10 +603,7 @@ def demo() -> None:
     equator_lon = [(0, 0), (1, 0)]
 
     results: typing.Dict[str, typing.Dict[str, float]] = {}
-    global RADIUS_EARTH
     for radius in [6371, 6371.008771415, 6371.0088, 6371.2]:
-        RADIUS_EARTH = radius
-        CONVERSIONS[DistanceUnit.KM] = radius
         for target, coords, benchmark in zip(["White House <->\nEiffel Tower",
                                               "Lyon <->\nParis",
                                               "Longitude at\nthe equator"],
@@ -260,20 +622,20 @@ def demo() -> None:
                     ).max() * 6371,
                 "heri_haversine": heri_haversine(*unpack_coords(coords)),
                 "haversine": calculate_haversine_distance(
-                    *unpack_coords(coords)),
+                    *unpack_coords(coords), radius=radius),
                 "vincenty**": pygeodesy.formy.vincentys(
                     *unpack_coords(coords))/1000,
                 "heri_vincenty": heri_vincenty(*unpack_coords(coords)),
                 "vincenty": calculate_vincenty_distance(
-                    *unpack_coords(coords)),
+                    *unpack_coords(coords), radius=radius),
                 "law_of_cosines**": pygeodesy.formy.cosineLaw(
                     *unpack_coords(coords))/1000,
                 "law_of_cosines": calculate_law_of_cosines_distance(
-                    *unpack_coords(coords)),
+                    *unpack_coords(coords), radius=radius),
                 "benchmark": benchmark
                             }
         df: pd.DataFrame = pd.DataFrame().from_dict(results)
-        print(f"Radius of the earth: {RADIUS_EARTH}",
+        print(f"Radius of the earth: {radius}",
               df.to_markdown(floatfmt=".3f"),
               sep="\n", end="\n\n")
 
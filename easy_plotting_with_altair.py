@@ -4,14 +4,23 @@ visualizations using well-known datasets.
 """
 
 # Standard library
-import io
+import concurrent.futures
+import functools
+import os
+import pathlib
+import shutil
 import typing
 # Third party
 import altair as alt
 import pandas as pd
 import plotly
+import pyarrow.csv
 import requests
 import vega_datasets
+try:
+    import vegafusion
+except ImportError:  # vegafusion is optional
+    vegafusion = None
 # Enable browser rendering for Altair
 alt.renderers.enable("browser")
 # Constants for chart dimensions and colors
@@ -26,13 +35,101 @@ TITLE_COLOR: str = "darkgrey"
 DISCRETE_COLOR_SCHEME: str = "dark2"
 CONTINUOUS_COLOR_SCHEME: str = "spectral"
 COLOR: str = "rebeccapurple"
+# File paths
+HOUSING_FILENAME: str = "data/housing.csv"
 
 
+@functools.lru_cache(maxsize=None)
 def format_label(label_text: str) -> str:
     """
     Formats the label by replacing underscores with spaces and capitalizing.
     """
-    return " ".join(label_text.split("_")).capitalize()
+    return label_text.replace("_", " ").capitalize()
+
+
+def _shrink_dtypes(dataset: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcasts the integer columns to the smallest integer type that fits the
+    values. Float columns are kept as float64, since float32 values would be
+    written to the JSON spec with more digits instead of fewer.
+    """
+    return dataset.assign(**{
+        column: pd.to_numeric(dataset[column], downcast="integer")
+        for column in dataset.select_dtypes("integer").columns})
+
+
+def _read_csv(source: typing.Union[str, typing.BinaryIO]) -> pd.DataFrame:
+    """
+    Reads a CSV file with PyArrow's multithreaded CSV reader.
+    """
+    table: pyarrow.Table = pyarrow.csv.read_csv(
+        source,
+        read_options=pyarrow.csv.ReadOptions(use_threads=True,
+                                             block_size=1 << 20),
+        # Read missing strings (e.g. 'NA') as null values like Pandas
+        convert_options=pyarrow.csv.ConvertOptions(strings_can_be_null=True))
+    return table.to_pandas()
+
+
+def read_csv_from_url(
+    url: str,
+    filename: str
+        ) -> pd.DataFrame:
+    """
+    Reads a CSV file from a local file or a remote URL. If the local file does
+    not exist, the response is streamed to the file for future use.
+
+    Parameters:
+        url : The URL of the CSV file.
+        filename : The name of the local file to read from.
+
+    Returns:
+        The CSV file as a DataFrame.
+    """
+    try:
+        dataset: pd.DataFrame = _read_csv(filename)
+        print(f"{filename} retrieved from local file.")
+    except FileNotFoundError:
+        print(f"Retrieving data from {url}...")
+        pathlib.Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        partial_filename: str = f"{filename}.part"
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()  # Raise an error for bad responses
+            response.raw.decode_content = True  # Undo any gzip encoding
+            with open(partial_filename, "wb") as file:
+                shutil.copyfileobj(response.raw, file)
+        # Only store the file once it is complete
+        os.replace(partial_filename, filename)
+        print(f"{filename} saved to local file.")
+        dataset: pd.DataFrame = _read_csv(filename)
+    return dataset
+
+
+def _correlation_text(
+    r_value: float,
+    x_position: int,
+    y_position: int
+        ) -> alt.Chart:
+    """
+    Creates a text chart with a Pearson correlation coefficient.
+
+    Parameters:
+        r_value : The correlation coefficient, calculated in Pandas.
+        x_position : The position of the text in pixels from the left.
+        y_position : The position of the text in pixels from the top.
+
+    Returns:
+        A chart displaying the correlation coefficient.
+    """
+    return alt.Chart(pd.DataFrame({"label": [f"R: {r_value:.2f}"]})
+                     ).mark_text(
+        fontWeight="bold"
+        ).encode(
+        x=alt.value(x_position),
+        y=alt.value(y_position),
+        text="label:N",
+        color=alt.value(COLOR)
+        )
 
 
 def part1(
@@ -56,9 +153,13 @@ def part1(
     x_value: str = f"{feature_property}:{encoding_x}"
     y_value: str = f"{target_property}:{encoding_y}"
     line_color: str = "darkslategray"
-    # Determine the range of years
-    first_year: int = dataset["year"].dt.year.min()
-    last_year: int = dataset["year"].dt.year.max()
+    # Only keep the used columns as the data is embedded in the chart
+    dataset = dataset[["country", feature_property, target_property]]
+    # Determine the sorted, unique years once for the axis and its range
+    years: pd.DatetimeIndex = pd.DatetimeIndex(
+        dataset[feature_property].unique()).sort_values()
+    first_year: int = years[0].year
+    last_year: int = years[-1].year
     # Create line charts for all and the average life expectancy
     base_chart: alt.Chart = alt.Chart(dataset).mark_line(
         color=SUBDUED_COLOR, strokeWidth=1).encode(
@@ -68,7 +169,7 @@ def part1(
                     grid=False,
                     labelColor=SUBTITLE_COLOR,  # Color the axis label
                     titleColor=TITLE_COLOR,  # Color the axis title
-                    values=sorted(dataset["year"].unique())),
+                    values=years.to_list()),
                 # Extend beyond the years in the dataset
                 scale=alt.Scale(
                     domain=(pd.to_datetime([first_year-2], format="%Y")[0],
@@ -79,49 +180,60 @@ def part1(
                               titleColor=TITLE_COLOR),
                 title="Life expectancy (in years)"),
         detail="country:N")
-    avg_line: alt.Chart = alt.Chart(dataset).mark_line(
+    # Aggregate the data in Pandas so only the results are added to the chart
+    highlighted: pd.DataFrame = dataset[dataset["country"].isin(
+        ["Afghanistan", "Brazil", "Netherlands"])]
+    medians: pd.DataFrame = dataset.groupby(
+        feature_property, as_index=False)[target_property].median()
+    # Build the means column by column, so every column keeps its own dtype
+    means: pd.DataFrame = pd.DataFrame({
+        feature_property: [dataset[feature_property].mean()],
+        target_property: [dataset[target_property].mean()]})
+    extremes: pd.DataFrame = highlighted.groupby("country").agg(
+        first=(feature_property, "min"), last=(feature_property, "max"),
+        minimum=(target_property, "min"), maximum=(target_property, "max")
+        ).reset_index()
+    avg_line: alt.Chart = alt.Chart(medians).mark_line(
         color=line_color, strokeDash=(4, 4)  # 4 pixels line, 4 pixels gap
         ).encode(
-        x=x_value, y=f"median({target_property}):{encoding_y}")
+        x=x_value, y=y_value)
     # Create subset for highlighted countries
-    subset: alt.Chart = alt.Chart(dataset).encode(
-        x=x_value, y=y_value,
-        color=alt.Color("country:N", legend=None
-                        ).scale(scheme=DISCRETE_COLOR_SCHEME)
-        ).transform_filter(
-        alt.FieldOneOfPredicate(
-            field="country", oneOf=["Afghanistan", "Brazil", "Netherlands"]))
+    country_color: alt.Color = alt.Color("country:N", legend=None
+                                         ).scale(scheme=DISCRETE_COLOR_SCHEME)
+    subset: alt.Chart = alt.Chart(highlighted).encode(
+        x=x_value, y=y_value, color=country_color)
+    annotation: alt.Chart = alt.Chart(extremes).encode(color=country_color)
     # Create highlight and text annotations
     highlight: alt.Chart = subset.mark_line(point=True).encode()
-    avg_text: alt.Chart = avg_line.mark_text(
+    avg_text: alt.Chart = alt.Chart(means).mark_text(
         angle=347,  # Hardcoded angle to have text perpendicular to line
         baseline="middle", color=line_color, fontWeight="bold"
         ).encode(
-        x=f"mean({feature_property}):{encoding_x}",
-        y=alt.Y(f"{target_property}").aggregate("mean"),
+        x=x_value, y=y_value,
         text=alt.datum("Median life expactancy")
         )
-    country_name: alt.Chart = subset.mark_text(
+    country_name: alt.Chart = annotation.mark_text(
         align="left", angle=355, baseline="bottom", dy=-7, fontWeight="bold"
         ).encode(
-        x=f"min({feature_property})", y=alt.Y(y_value).aggregate("min"),
+        x=f"first:{encoding_x}", y=f"minimum:{encoding_y}",
         text="country:N"
         )
-    min_exp: alt.Chart = subset.mark_text(
+    min_exp: alt.Chart = annotation.mark_text(
         align="right", dx=-10, dy=-5, fontWeight="bold"
         ).encode(
-        x=f"min({feature_property})", y=f"min({target_property}):{encoding_y}",
-        text=alt.Text(f"min({target_property})", format=ROUND_TO_NEXT_INTEGER))
-    max_exp: alt.Chart = subset.mark_text(
+        x=f"first:{encoding_x}", y=f"minimum:{encoding_y}",
+        text=alt.Text("minimum", format=ROUND_TO_NEXT_INTEGER))
+    max_exp: alt.Chart = annotation.mark_text(
         align="left",
         dx=10, dy=-5,
         fontWeight="bold"
         ).encode(
-        x=f"max({feature_property})", y=f"max({target_property}):{encoding_y}",
-        text=alt.Text(f"max({target_property})", format=ROUND_TO_NEXT_INTEGER))
+        x=f"last:{encoding_x}", y=f"maximum:{encoding_y}",
+        text=alt.Text("maximum", format=ROUND_TO_NEXT_INTEGER))
     # Combine all charts into a layered chart
-    combined_chart: alt.LayerChart = (
-        base_chart+avg_line+highlight+avg_text+country_name+min_exp+max_exp
+    combined_chart: alt.LayerChart = alt.layer(
+        base_chart, avg_line, highlight, avg_text, country_name, min_exp,
+        max_exp
         ).properties(
         height=HEIGHT, width=WIDTH,
         title=alt.Title(
@@ -156,28 +268,31 @@ def part2(
     x_property: str = "Yr Sold"
     y_property: str = "SalePrice"
     facet_property: str = "Neighborhood"
+    bin_size: int = 100_000
     # Determine if the average sale price is empty
     empty_value: int = 0
     is_empty = alt.datum.avg_sale_price == empty_value
+    # Aggregate the sales per neighborhood and year
+    aggregated: pd.DataFrame = dataset.groupby(
+        [facet_property, x_property])[y_property].agg(
+        avg_sale_price="mean",  # Take the average of SalePrice
+        number_of_sales="size"  # Count the number of sales
+        )
+    # Impute the years without sales as a single sale of the empty value
+    aggregated = aggregated.reindex(
+        pd.MultiIndex.from_product(
+            [dataset[facet_property].unique(), dataset[x_property].unique()],
+            names=[facet_property, x_property])
+        ).fillna(
+        {"avg_sale_price": empty_value, "number_of_sales": 1}
+        ).astype({"number_of_sales": int}).reset_index()
+    # Bin the average sale price by the start of its bin
+    aggregated["Average Sale Price"] = (
+        aggregated["avg_sale_price"] // bin_size * bin_size).astype(int)
     # Create the chart
     chart: alt.FacetChart = alt.Chart(
-        data=dataset,
+        data=aggregated,
         height=HEIGHT//(number_of_rows + 1), width=WIDTH//number_of_columns
-        ).transform_impute(
-        impute=y_property,  # The property that has a missing value
-        value=empty_value,  # The fill value for missing values
-        key=facet_property,  # The key to identify unique data
-        groupby=[x_property],  # Force imputation on a per-group basis
-        method="value"  # The method for imputation
-        ).transform_aggregate(
-        avg_sale_price=f"mean({y_property})",  # Take the average of SalePrice
-        number_of_sales=f"count({y_property})",  # Count the number of sales
-        # Force the transformation on a per-group basis
-        groupby=[facet_property, x_property]
-        ).transform_bin(
-        as_="Average Sale Price",
-        bin=alt.BinParams(step=100_000),  # Set the bin size
-        field="avg_sale_price"
         ).mark_point().encode(
         x=alt.X(f"{x_property}:N").title("Year of sale"),
         y=alt.Y("number_of_sales:Q").title("Number of sales"),
@@ -237,25 +352,19 @@ def part3(
         regression lines.
     """
     target_property: str = "Miles_per_Gallon"
+    feature_properties: typing.List[str] =\
+        ["Horsepower", "Displacement", "Weight_in_lbs"]
     encoding: str = "Q"
-    # Create the base chart and apply all the settings as charts with a config
-    # cannot be concatenated or layered.
-    combined: alt.HConcatChart = alt.hconcat(
-        ).properties(
-        title=alt.Title(
-            "Influence of vehicles attributes on performance",
-            anchor="middle", color=TITLE_COLOR, fontSize=TITLE_SIZE,
-            subtitle="Comparing the effect of horsepower, displacement and weight on miles per gallon.",  # noqa E501
-            subtitleColor=SUBTITLE_COLOR, subtitleFontSize=SUBTITLE_SIZE)
-        ).configure_axis(
-        labelColor=SUBTITLE_COLOR, titleColor=TITLE_COLOR
-        ).configure_view(
-        strokeOpacity=0  # Hide all axis
-        )
+    # Only keep the used columns as the data is embedded in the chart
+    dataset = dataset[[*feature_properties, target_property]]
+    # Determine the range of the target once for all color scales
+    target_min, target_max = dataset[target_property].agg(["min", "max"])
+    # Calculate the Pearson correlation coefficients in a single matrix
+    r_values: pd.Series = dataset.corr(method="pearson")[target_property]
     # Iterate through the specified columns to create scatter plots
-    for idx, column in enumerate(
-            ["Horsepower", "Displacement", "Weight_in_lbs"]):
-        column_base: alt.Chart = alt.Chart(dataset).encode(
+    panels: typing.List[alt.LayerChart] = []
+    for idx, column in enumerate(feature_properties):
+        column_base: alt.Chart = alt.Chart().encode(
             x=alt.X(f"{column}:{encoding}",
                     axis=alt.Axis(grid=False),
                     title=format_label(column)),
@@ -274,46 +383,36 @@ def part3(
                     scheme=CONTINUOUS_COLOR_SCHEME,
                     # Invert the color scheme by setting the domain from the
                     # maximum value to the minimum value
-                    domain=[dataset[target_property].max(),
-                            dataset[target_property].min()]),
+                    domain=[target_max, target_min]),
                     ))
         # Create regression line
         regression_line: alt.Chart = column_base.transform_regression(
             column, target_property, method="linear").mark_line(
             color=COLOR)
         # Calculate the Pearson correlation coefficient and add the text
-        coefficient: alt.Chart = row.transform_filter(
-            # Filter out any value is null, undefined, or NaN
-            f"isValid(datum.{target_property})"
-            ).transform_joinaggregate(
-            # Calculate the mean for x and y and join it to the dataset
-            mean_x=f"mean({column})", mean_y=f"mean({target_property})"
-            ).transform_calculate(
-            # Calculate the variance per row
-            sub=(f"(datum.{column} - datum.mean_x) *"
-                 f" (datum.{target_property} - datum.mean_y)")
-            ).transform_aggregate(
-            std_x=f"stdev({column})", std_y=f"stdev({target_property})",
-            length_x=f"count({column})",
-            # Calculate covariance
-            cov_sub="sum(sub)"
-            ).transform_calculate(
-            # Finalize calculating the correlation coefficient
-            r_value=("(datum.cov_sub/datum.length_x)/"
-                     "(datum.std_x * datum.std_y)"),
-            label='"R: "+format(datum.r_value,".2f")'  # Create the label
-            ).mark_text(
-            fontWeight="bold"
-            ).encode(
-            x=alt.value(200),  # Position in pixels from left
-            y=alt.value(300),  # Position in pixels from top
-            text="label:N",
-            color=alt.value(COLOR)
-            )
+        coefficient: alt.Chart = _correlation_text(
+            r_values[column],
+            x_position=200,  # Position in pixels from left
+            y_position=300)  # Position in pixels from top
         # Combine the row, regression line, and coefficient into the final
-        # panel and concatenate it to the chart
-        combined |= (row + regression_line + coefficient).properties(
-            height=HEIGHT, width=WIDTH//3)
+        # panel
+        panels.append((row + regression_line + coefficient).properties(
+            height=HEIGHT, width=WIDTH//3))
+    # Concatenate all panels at once and apply all the settings. The data is
+    # set once on the concatenated chart and inherited by the panels.
+    combined: alt.HConcatChart = alt.hconcat(
+        *panels, data=dataset
+        ).properties(
+        title=alt.Title(
+            "Influence of vehicles attributes on performance",
+            anchor="middle", color=TITLE_COLOR, fontSize=TITLE_SIZE,
+            subtitle="Comparing the effect of horsepower, displacement and weight on miles per gallon.",  # noqa E501
+            subtitleColor=SUBTITLE_COLOR, subtitleFontSize=SUBTITLE_SIZE)
+        ).configure_axis(
+        labelColor=SUBTITLE_COLOR, titleColor=TITLE_COLOR
+        ).configure_view(
+        strokeOpacity=0  # Hide all axis
+        )
     return combined
 
 
@@ -331,28 +430,36 @@ def part4(
         A vertical concatenated chart displaying the comparisons.
     """
     category_name: str = "species"
-    base: alt.Chart = alt.Chart(
-        dataset, height=HEIGHT//2, width=WIDTH//2
-        ).mark_circle()
+    # Only keep the used columns as the data is embedded in the chart
+    dataset = dataset[[category_name, "sepal_length", "sepal_width",
+                       "petal_length", "petal_width"]]
+    # Determine the shared axis domains once for both charts
+    x_max: float = dataset["sepal_length"].round().max()
+    y_max: float = dataset["sepal_width"].round().max() + 1
     # Define a selection parameter for species on the legend
     selection: alt.Parameter =\
         alt.selection_point(fields=[category_name], bind="legend")
+    # Define the encodings shared by both charts once on the base chart
+    base: alt.Chart = alt.Chart(
+        dataset, height=HEIGHT//2, width=WIDTH//2
+        ).mark_circle().encode(
+        color=alt.Color(f"{category_name}:N",
+                        scale=alt.Scale(scheme=DISCRETE_COLOR_SCHEME)),
+        opacity=(alt.when(selection)
+                 .then(alt.value(.8)).otherwise(alt.value(.2))))
+    category_tooltip: alt.Tooltip = alt.Tooltip(
+        f"{category_name}:N", title=format_label(category_name))
     # Generate scatter plots for each pair of measurements
     charts: typing.List[alt.Chart] = [base.encode(
         x=alt.X(f"{x}:Q", title=format_label(x),
                 scale=alt.Scale(
-                    domain=[0, dataset["sepal_length"].round().max()])),
+                    domain=[0, x_max])),
         y=alt.Y(f"{y}:Q", title=format_label(y),
                 scale=alt.Scale(
-                    domain=[0, dataset["sepal_width"].round().max()+1])),
-        color=alt.Color(f"{category_name}:N",
-                        scale=alt.Scale(scheme=DISCRETE_COLOR_SCHEME)),
-        tooltip=[alt.Tooltip(f"{category_name}:N",
-                             title=format_label(category_name)),
+                    domain=[0, y_max])),
+        tooltip=[category_tooltip,
                  alt.Tooltip(f"{x}:Q", title=format_label(x)),
-                 alt.Tooltip(f"{y}:Q", title=format_label(y))],
-        opacity=(alt.when(selection)
-                 .then(alt.value(.8)).otherwise(alt.value(.2)))
+                 alt.Tooltip(f"{y}:Q", title=format_label(y))]
         ) for x, y in zip(["sepal_length", "petal_length"],
                           ["sepal_width", "petal_width"])]
     # Combine the charts into a vertical concatenated chart with properties
@@ -383,11 +490,17 @@ def part5(
         A vertical concatenation of scatter and correlation plots.
     """
     # Standardize column names by replacing spaces with underscores
-    dataset.columns = [col.replace(" ", "_") for col in dataset.columns]
+    dataset = dataset.rename(columns=lambda col: col.replace(" ", "_"))
     features = ["Year_Built", "Yr_Sold", "Lot_Area", "Overall_Qual"]
     # Set the y-axis
     target_property: str = "SalePrice"
     title_y_axis: str = "Sale price"
+    # Only keep the used columns as the data is embedded in the chart
+    dataset = dataset[[*features, target_property]]
+    # Determine the range of the target once for all scales
+    target_min, target_max = dataset[target_property].agg(["min", "max"])
+    # Calculate the Pearson correlation coefficients in a single matrix
+    r_values: pd.Series = dataset.corr(method="pearson")[target_property]
     # Create scatter plots for each feature against the target property
     # creating a RepeatChart
     scatter_plots: alt.RepeatChart = alt.Chart(
@@ -398,49 +511,26 @@ def part5(
         y=alt.Y(f"{target_property}:Q", title=title_y_axis),
         color=alt.Color(target_property, legend=None,
                         scale=alt.Scale(scheme=CONTINUOUS_COLOR_SCHEME,
-                                        domain=[dataset[target_property].max(),
-                                                dataset[target_property].min()]
-                                        ))
+                                        domain=[target_max, target_min]))
         ).repeat(
         features, columns=2)
     # Create correlation plots for each feature against the target property
     correlation: alt.VConcatChart = alt.vconcat(
-        *[(alt.Chart(dataset).encode(
+        *[(alt.Chart().encode(
           x=feature,
           y=alt.Y(target_property,
-                  scale=alt.Scale(domain=[0, dataset[target_property].max()]),
+                  scale=alt.Scale(domain=[0, target_max]),
                   title=title_y_axis)
           ).transform_regression(
           feature, target_property
           ).mark_line(color=COLOR) +
-          alt.Chart(dataset).encode(
-          x=feature, y=target_property
-          ).transform_joinaggregate(
-          # Calculate the mean for x and y and join it to the dataset
-          mean_x=f"mean({feature})", mean_y=f"mean({target_property})"
-          ).transform_calculate(
-          # Calculate the variance per row
-          sub=(f"(datum.{feature} - datum.mean_x) *"
-               f" (datum.{target_property} - datum.mean_y)")
-          ).transform_aggregate(
-          std_x=f"stdev({feature})", std_y=f"stdev({target_property})",
-          length_x=f"count({feature})",
-          # Calculate covariance
-          cov_sub="sum(sub)"
-          ).transform_calculate(
-          # Finalize calculating the correlation coefficient
-          r_value=("(datum.cov_sub/datum.length_x)/"
-                   "(datum.std_x * datum.std_y)"),
-          label='"R: "+format(datum.r_value,".2f")'  # Create the label
-          ).mark_text(
-          fontWeight="bold"
-          ).encode(
-          x=alt.value(150),  # Position in pixels from left
-          y=alt.value(100),  # Position in pixels from top
-          text="label:N",
-          color=alt.value(COLOR)
-          )).properties(height=HEIGHT//5, width=WIDTH//5)
-          for feature in features])
+          _correlation_text(r_values[feature],
+                            x_position=150,  # Position in pixels from left
+                            y_position=100)  # Position in pixels from top
+          ).properties(height=HEIGHT//5, width=WIDTH//5)
+          for feature in features],
+        data=dataset  # Set the data once, inherited by the regression lines
+        )
     # Combine scatter plots and correlation plots with titles and styling
     combined = (scatter_plots | correlation).configure_axis(
         labelColor=SUBTITLE_COLOR, titleColor=TITLE_COLOR
@@ -459,25 +549,39 @@ def main() -> None:
     """
     Main function to load datasets and create plots.
     """
-    # Load the gapminder dataset and convert years to datetime object
-    gapminder: pd.DataFrame = plotly.data.gapminder()
-    gapminder["year"] = pd.to_datetime(gapminder["year"], format="%Y")
-    # Load the housing dataset by reading the retreived csv into a Pandas
-    # DataFrame
+    # Evaluate the remaining Vega transforms (e.g. the regressions) in
+    # VegaFusion before rendering, so only their results are sent to the
+    # browser. This is done here and not on import, as VegaFusion does not
+    # support writing the charts to a Vega-Lite spec with to_json().
+    if vegafusion is not None:
+        alt.data_transformers.enable("vegafusion")
     url: str = (
         r"https://raw.githubusercontent.com/wblakecannon/ames/refs/"
         r"heads/master/data/housing.csv")
-    housing: pd.DataFrame = pd.read_csv(
-        io.BytesIO(requests.get(url).content), sep=",")
-    # Load the cars and iris datasets
-    mt_cars: pd.DataFrame = vega_datasets.data.cars()
-    iris: pd.DataFrame = plotly.data.iris()
-    # Create and show plots
-    part1(gapminder).show()
-    part2(housing).show()
-    part3(mt_cars).show()
-    part4(iris).show()
-    part5(housing).show()
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        # Load the datasets concurrently, the housing dataset is retrieved
+        # by reading the (cached) csv from the url into a Pandas DataFrame
+        gapminder_future: concurrent.futures.Future =\
+            executor.submit(plotly.data.gapminder)
+        housing_future: concurrent.futures.Future =\
+            executor.submit(read_csv_from_url, url, HOUSING_FILENAME)
+        mt_cars_future: concurrent.futures.Future =\
+            executor.submit(vega_datasets.data.cars)
+        iris_future: concurrent.futures.Future =\
+            executor.submit(plotly.data.iris)
+        # Convert the years of the gapminder dataset to datetime objects
+        gapminder: pd.DataFrame = _shrink_dtypes(gapminder_future.result())
+        gapminder["year"] = pd.to_datetime(gapminder["year"], format="%Y")
+        housing: pd.DataFrame = _shrink_dtypes(housing_future.result())
+        # Create the plots concurrently and show them in their order
+        charts: typing.List[concurrent.futures.Future] = [
+            executor.submit(part, dataset) for part, dataset in [
+                (part1, gapminder), (part2, housing),
+                (part3, _shrink_dtypes(mt_cars_future.result())),
+                (part4, _shrink_dtypes(iris_future.result())),
+                (part5, housing)]]
+        for chart in charts:
+            chart.result().show()
 
 
 if __name__ == "__main__":
@@ -5,6 +5,10 @@ author: UnicornOnAzur
 This module generates visual comparisons between the Mercator and Equal Earth
 projections using GeoPandas and Cartopy libraries.
 """
+# Standard library
+import concurrent.futures
+import os
+import typing
 # Third party
 import cartopy
 import geopandas as gpd
@@ -15,6 +19,14 @@ EARTH_COLOR: str = "tan"
 BORDER_COLOR: str = "darkgrey"
 HEIGHT: int = 5
 WIDTH: int = 14
+# Projections to compare in GeoPandas
+PROJECTIONS: typing.Tuple[typing.Union[int, str], ...] =\
+    (4326, "+proj=eqearth", 8857, 8858, 8859)
+# Tolerance in degrees to simplify the geometries with, as finer detail is
+# smaller than a pixel in the subplots
+SIMPLIFY_TOLERANCE: float = 0.2
+# Natural Earth scale matching the resolution of the plots
+CARTOPY_SCALE: str = "110m"
 
 
 def equal_earth_geopandas() -> None:
@@ -29,24 +41,28 @@ def equal_earth_geopandas() -> None:
         None
     """
     world: gpd.GeoDataFrame = gpd.read_file("data/naturalearth_lowres.shp")
+    world["geometry"] = world.geometry.simplify(SIMPLIFY_TOLERANCE,
+                                                preserve_topology=True)
+    # Reproject the world once per projection, in parallel as each
+    # reprojection is independent and CPU bound
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(len(PROJECTIONS), os.cpu_count() or 1)
+            ) as executor:
+        projected: typing.Dict[typing.Union[int, str], gpd.GeoDataFrame] =\
+            dict(zip(PROJECTIONS, executor.map(world.to_crs, PROJECTIONS)))
     #
     fig, axes = plt.subplots(ncols=3, nrows=2, figsize=(WIDTH, HEIGHT))
     fig.subplots_adjust(left=.05, right=.95, bottom=0, top=.9, wspace=.1)
     fig.suptitle("Projections in GeoPandas")
-    for idx, (ax, crs) in enumerate(
-                            zip(axes.flatten(),
-                                (4326, "+proj=eqearth", 8857, 8858, 8859, None)
-                                )):
-        if idx == 5:  # remove the last, unused axis
-            ax.remove()
-            break
+    for ax, crs in zip(axes.flatten(), PROJECTIONS):
         ax.set_facecolor(WATER_COLOR)
-        world.to_crs(crs).plot(ax=ax,
-                               edgecolor=BORDER_COLOR,
-                               facecolor=EARTH_COLOR,
-                               aspect="auto"
-                               )
+        projected[crs].plot(ax=ax,
+                            edgecolor=BORDER_COLOR,
+                            facecolor=EARTH_COLOR,
+                            aspect="auto"
+                            )
         ax.set_title(crs)
+    axes.flatten()[-1].remove()  # remove the last, unused axis
     fig.savefig("output/equal_earth_geopandas.png")
 
 
@@ -64,9 +80,11 @@ def equal_earth_cartopy() -> None:
     for rect, crs in zip((121, 122),
                          (cartopy.crs.Mercator(), cartopy.crs.EqualEarth())):
         ax: cartopy.mpl.geoaxes.GeoAxes = fig.add_subplot(rect, projection=crs)
-        ax.add_feature(cartopy.feature.LAND, color=EARTH_COLOR)
-        ax.add_feature(cartopy.feature.BORDERS, color=BORDER_COLOR)
-        ax.coastlines(color=BORDER_COLOR)
+        ax.add_feature(cartopy.feature.LAND.with_scale(CARTOPY_SCALE),
+                       color=EARTH_COLOR)
+        ax.add_feature(cartopy.feature.BORDERS.with_scale(CARTOPY_SCALE),
+                       color=BORDER_COLOR)
+        ax.coastlines(resolution=CARTOPY_SCALE, color=BORDER_COLOR)
         ax.set_facecolor(WATER_COLOR)
         ax.set_title(crs.proj4_params["proj"])
     fig.savefig("output/equal_earth_cartopy.png")
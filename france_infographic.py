@@ -15,8 +15,9 @@ The process involves the following steps:
 5. Store the infographic.
 """
 # Standard library
-import datetime
+import concurrent.futures
 import io
+import os
 import typing
 # Third-party
 import PIL.Image
@@ -34,6 +35,8 @@ GEOJSON_FILENAME: str = f"{DATA_FOLDER}france.geojson"
 WIKI_FILE: str = f"{DATA_FOLDER}html.txt"
 XLS_FILENAME: str = f"{DATA_FOLDER}evolution-population-dep-2010-2023.xls"
 LOGO_FILENAME: str = f"{DATA_FOLDER}logo.png"
+GDF_FILENAME: str = f"{DATA_FOLDER}france.parquet"
+WIKI_TABLE_FILENAME: str = f"{DATA_FOLDER}wiki_table.parquet"
 # URLS
 GEOJSON_URL: str =\
     "https://france-geojson.gregoiredavid.fr/repo/departements.geojson"
@@ -121,10 +124,13 @@ def fetch_files() -> tuple[bytes, bytes, io.BytesIO]:
         A tuple containing GeoJSON data, Wikipedia page content, and population
         statistics in bytes format.
     """
-
-    geojson_bytes: bytes = _fetch_data(GEOJSON_FILENAME, GEOJSON_URL)
-    page_content: bytes = _fetch_data(WIKI_FILE, WIKIPEDIA_URL)
-    population: bytes = _fetch_data(XLS_FILENAME, XLS_URL)
+    # Fetch the files concurrently as the downloads are I/O bound and each
+    # one is written to a different file
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        geojson_bytes, page_content, population = executor.map(
+            _fetch_data,
+            (GEOJSON_FILENAME, WIKI_FILE, XLS_FILENAME),
+            (GEOJSON_URL, WIKIPEDIA_URL, XLS_URL))
     return geojson_bytes, page_content, io.BytesIO(population)
 
 
@@ -156,18 +162,61 @@ def _validate_data(
     Returns:
         None
     """
-    assert gdf.loc[gdf[COLUMN_CODE_NEW].idxmin(), COLUMN_NAME] == "Ain"
-    assert gdf.loc[gdf[COLUMN_CODE_NEW].idxmax(), COLUMN_NAME] == "Val-d'Oise"
-    assert gdf.loc[gdf[COLUMN_AREA].idxmin(), COLUMN_NAME] == "Paris"
-    assert gdf.loc[gdf[COLUMN_AREA].idxmax(), COLUMN_NAME] == "Gironde"
-    assert gdf.loc[gdf[COLUMN_POPULATION].idxmin(), COLUMN_NAME] == "Lozère"
-    assert gdf.loc[gdf[COLUMN_POPULATION].idxmin(),
+    # Find the positions of all extremes in a single aggregation
+    extremes: pd.DataFrame = gdf[
+        [COLUMN_CODE_NEW, COLUMN_AREA, COLUMN_POPULATION]
+        ].agg(["idxmin", "idxmax"])
+    lowest: pd.Series = gdf.loc[extremes.loc["idxmin"], COLUMN_NAME]
+    highest: pd.Series = gdf.loc[extremes.loc["idxmax"], COLUMN_NAME]
+    assert lowest.iat[0] == "Ain"
+    assert highest.iat[0] == "Val-d'Oise"
+    assert lowest.iat[1] == "Paris"
+    assert highest.iat[1] == "Gironde"
+    assert lowest.iat[2] == "Lozère"
+    assert gdf.loc[extremes.at["idxmin", COLUMN_POPULATION],
                    COLUMN_POPULATION] == 76648
-    assert gdf.loc[gdf[COLUMN_POPULATION].idxmax(), COLUMN_NAME] == "Nord"
-    assert gdf.loc[gdf[COLUMN_POPULATION].idxmax(),
+    assert highest.iat[2] == "Nord"
+    assert gdf.loc[extremes.at["idxmax", COLUMN_POPULATION],
                    COLUMN_POPULATION] == 2606646
-    assert gdf[COLUMN_DATE].min() == pd.Timestamp("1790-02-26 00:00:00")
-    assert gdf[COLUMN_DATE].max() == pd.Timestamp("1979-01-01 00:00:00")
+    first_date, last_date = gdf[COLUMN_DATE].agg(["min", "max"])
+    assert first_date == pd.Timestamp("1790-02-26 00:00:00")
+    assert last_date == pd.Timestamp("1979-01-01 00:00:00")
+
+
+def _read_establishment_dates(
+    page_content: bytes
+        ) -> pd.Series:
+    """
+    Reads the establishment dates per INSEE code from a local Parquet file, or
+    parses them from the table on the Wikipedia page and stores them for
+    future use.
+
+    The Parquet file is only used when it is newer than the local Wikipedia
+    file, so that the page is only parsed again when it changes.
+
+    Parameters:
+        page_content : The HTML content from Wikipedia containing
+            establishment dates.
+
+    Returns:
+        The establishment dates as text, indexed by INSEE code.
+    """
+    try:
+        if os.path.getmtime(WIKI_TABLE_FILENAME) >\
+                os.path.getmtime(WIKI_FILE):
+            print(f"{WIKI_TABLE_FILENAME} retrieved from local file.")
+            return pd.read_parquet(WIKI_TABLE_FILENAME)[COLUMN_DATE]
+    except FileNotFoundError:
+        pass
+    # Clean the INSEE codes form the table with the establisment dates
+    html: pd.DataFrame =\
+        pd.read_html(page_content)[3].iloc[2:, [0, 2]].astype({0: str})\
+        .set_index(0).drop(["69M"], axis="index")\
+        .rename(index={"69D": "69"})
+    dates: pd.Series = html[2].rename_axis(COLUMN_CODE)
+    dates.to_frame(COLUMN_DATE).to_parquet(WIKI_TABLE_FILENAME)
+    print(f"{WIKI_TABLE_FILENAME} saved to local file.")
+    return dates
 
 
 def create_gdf(
@@ -196,25 +245,20 @@ def create_gdf(
     gdf.to_crs(2154, inplace=True)
     gdf[COLUMN_AREA] = gdf["geometry"].area
     # Get a central point within the departments to use for labeling
-    gdf["coords"] = [coords[0] for coords in gdf["geometry"].apply(
-        lambda x: x.representative_point().coords[:])]
-    # Clean the INSEE codes form the table with the establisment dates from the
-    # Wikipedia page, and load it into a column
-    html: pd.DataFrame =\
-        pd.read_html(page_content)[3].iloc[2:, [0, 2]].astype({0: str})\
-        .set_index(0).drop(["69M"], axis="index").rename(index={"69D": "69"})
-    gdf[COLUMN_DATE] = pd.merge(left=gdf, right=html, left_on=COLUMN_CODE,
-                                right_on=html.index, how="left")[2].apply(
-                                lambda d:
-                                datetime.datetime.strptime(d, "%d %B %Y"))
+    points: gpd.GeoSeries = gdf.representative_point()
+    gdf["coords"] = list(zip(points.x, points.y))
+    # Load the establisment dates from the Wikipedia page into a column
+    gdf[COLUMN_DATE] = pd.to_datetime(
+        gdf[COLUMN_CODE].map(_read_establishment_dates(page_content)),
+        format="%d %B %Y")
     # Merge Corsica's two department numbers into one
     gdf[COLUMN_CODE_NEW] = gdf[COLUMN_CODE].replace({"2A": "20", "2B": "20"})
     # Load the population number in to a column
-    population: pd.DataFrame = pd.read_excel(population_bytes, sheet_name=2,
-                                             header=2, usecols=[0, 1])
-    gdf[COLUMN_POPULATION] = pd.merge(
-        left=gdf, right=population,
-        left_on=COLUMN_NAME, right_on="Département")[XLS_POPULATION_COLUMN]
+    # Read only the needed columns with the Rust based calamine engine
+    population: pd.Series = pd.read_excel(
+        population_bytes, sheet_name=2, header=2, usecols=[0, 1],
+        index_col=0, engine="calamine")[XLS_POPULATION_COLUMN]
+    gdf[COLUMN_POPULATION] = gdf[COLUMN_NAME].map(population)
     # Convert columns to appropriate data types
     gdf: gpd.GeoDataFrame = gdf.astype({COLUMN_CODE_NEW: int,
                                         COLUMN_POPULATION: int})
@@ -223,6 +267,35 @@ def create_gdf(
     return gdf
 
 
+def load_gdf() -> gpd.GeoDataFrame:
+    """
+    Loads the processed GeoDataFrame from a local Parquet file, or creates it
+    from the fetched files and stores it for future use.
+
+    The Parquet file is only used when it is newer than all of the files it
+    is created from, so that it is rebuilt when any of them change.
+
+    Parameters:
+        None
+
+    Returns:
+        A GeoDataFrame containing geographical and demographic data, and dates.
+    """
+    try:
+        if os.path.getmtime(GDF_FILENAME) > max(
+                map(os.path.getmtime,
+                    (GEOJSON_FILENAME, WIKI_FILE, XLS_FILENAME))):
+            print(f"{GDF_FILENAME} retrieved from local file.")
+            return gpd.read_parquet(GDF_FILENAME)
+    except FileNotFoundError:
+        pass
+    gdf: gpd.GeoDataFrame = create_gdf(*fetch_files())
+    # The geometries are stored already projected to Lambert-93
+    gdf.to_parquet(GDF_FILENAME)
+    print(f"{GDF_FILENAME} saved to local file.")
+    return gdf
+
+
 def make_figure(
         ) -> tuple[plt.Figure, typing.Dict[str, mpl.axes.Axes]]:
     """
@@ -315,33 +388,17 @@ def _create_custom_colormap(
     Returns:
         A colormap object that can be used in matplotlib visualizations.
     """
-    def _generate_color_values(
-        start1: float,
-        end1: float,
-        start2: float,
-        end2: float
-            ) -> np.ndarray:
-        """
-        Generates a concatenated array of color values.
-
-        Parameters:
-            start1 : Starting value for the first color range.
-            end1 : Ending value for the first color range.
-            start2 : Starting value for the second color range.
-            end2 : Ending value for the second color range.
-
-        Returns:
-            An array of concatenated color values.
-        """
-        return np.concatenate((np.linspace(start1, end1, number_of_points//2),
-                               np.linspace(start2, end2, number_of_points//2 +
-                                           number_of_points % 2)
-                               ), axis=None)
+    # The colormap goes up from blue to white in the first half, and down from
+    # white to red in the second half
+    half: int = number_of_points // 2
+    rising: np.ndarray = np.linspace(0, 1, half)
+    falling: np.ndarray = np.linspace(1, 0, number_of_points - half)
     # Create an array with RGBA channels
     vals: np.ndarray = np.ones((number_of_points, len("RGBA")))
-    vals[:, 0] = _generate_color_values(0, 1, 1, 1)  # Red channel
-    vals[:, 1] = _generate_color_values(0, 1, 1, 0)  # Green channel
-    vals[:, 2] = _generate_color_values(1, 1, 1, 0)  # Blue channel
+    vals[:half, 0] = rising  # Red channel
+    vals[:half, 1] = rising  # Green channel
+    vals[half:, 1] = falling  # Green channel
+    vals[half:, 2] = falling  # Blue channel
     return mpl.colors.ListedColormap(vals)
 
 
@@ -395,14 +452,12 @@ def _create_kde_colorbar(
     # Calculate midpoints for x and y
     x_midpts: np.ndarray = np.hstack((x[0], 0.5 * (x[1:] + x[:-1]), x[-1]))
     y_midpts: np.ndarray = np.hstack((y[0], 0.5 * (y[1:] + y[:-1]), y[-1]))
-    # Create segments for the colorbar
-    coord_start: np.ndarray = np.column_stack(
-        (x_midpts[:-1], y_midpts[:-1]))[:, np.newaxis, :]
-    coord_mid: np.ndarray = np.column_stack((x, y))[:, np.newaxis, :]
-    coord_end: np.ndarray = np.column_stack(
-        (x_midpts[1:], y_midpts[1:]))[:, np.newaxis, :]
-    segments: np.ndarray = np.concatenate(
-        (coord_start, coord_mid, coord_end), axis=1)
+    # Create segments for the colorbar, each going from the previous midpoint
+    # through the point to the next midpoint, in a single allocation
+    segments: np.ndarray = np.empty((len(x), 3, 2))
+    segments[:, 0, 0], segments[:, 0, 1] = x_midpts[:-1], y_midpts[:-1]
+    segments[:, 1, 0], segments[:, 1, 1] = x, y
+    segments[:, 2, 0], segments[:, 2, 1] = x_midpts[1:], y_midpts[1:]
     # Generate colors for each segment
     colors: np.ndarray = plt.colormaps[cmap_name](np.linspace(0, 1,
                                                               len(segments)))
@@ -410,12 +465,15 @@ def _create_kde_colorbar(
     lc: mpl.collections.LineCollection = mpl.collections.LineCollection(
         segments, linewidths=1.5, colors=colors, alpha=1, capstyle="butt")
     ax.add_collection(lc)
-    # Fill between segments with corresponding colors
-    for idx, segment in enumerate(segments):
-        ax.fill_between([segment[0][0], segment[-1][0]],
-                        [segment[0][1], segment[-1][1]],
-                        color=colors[idx]
-                        )
+    # Fill below the segments with corresponding colors, as one collection of
+    # polygons going from the x-axis to the start and end of each segment
+    polygons: np.ndarray = np.zeros((len(segments), 4, 2))
+    polygons[:, :2, 0] = segments[:, :1, 0]
+    polygons[:, 1, 1] = segments[:, 0, 1]
+    polygons[:, 2:, 0] = segments[:, -1:, 0]
+    polygons[:, 2, 1] = segments[:, -1, 1]
+    ax.add_collection(mpl.collections.PolyCollection(
+        polygons, facecolors=colors, edgecolors=colors))
     ax.set_ylim([0, max(y)*1.05])
     # Annotate the minimum and maximum values on the axes
     if min(dataset) > 10**7:
@@ -477,10 +535,10 @@ def _make_timeline(
         None
     """
     # Count occurrences of each year in the dataset
-    counts: pd.DataFrame = dataset.dt.year.value_counts()\
-        .reset_index().sort_values(COLUMN_DATE)
+    counts: pd.Series = dataset.dt.year.value_counts().sort_index()
+    years: np.ndarray = counts.index.to_numpy()
     # Calculate y positions using logarithmic scale
-    y_positions: np.ndarray = np.log(counts["count"]) + 1
+    y_positions: np.ndarray = np.log(counts.to_numpy()) + 1
     ymax: float = max(y_positions)
     time_range: typing.List[int] = [1775, 2025]
     # Add a timeline by adding a horizontal line with major and minor ticks.
@@ -499,14 +557,13 @@ def _make_timeline(
     ax.annotate(" French revolution:\n 1789-1799", (1789, 7),
                 xytext=(1777, .5),  size=5, rotation=90,
                 arrowprops={"arrowstyle": "-", "color": "grey"})
-    # Plot establishment years with annotations
-    for x_pos, y_pos, count, color in zip(
-            counts[COLUMN_DATE],
-            y_positions,
-            counts["count"],
-            mpl.colormaps["plasma"](np.linspace(0, 1, counts.shape[0]))):
-        ax.vlines(x=x_pos, ymin=0, ymax=y_pos, colors=color, alpha=.7)
-        ax.plot(x_pos, y_pos, "ko", mfc=color)
+    # Plot establishment years at once, and annotate them one by one
+    colors: np.ndarray =\
+        mpl.colormaps["plasma"](np.linspace(0, 1, counts.shape[0]))
+    ax.vlines(x=years, ymin=0, ymax=y_positions, colors=colors, alpha=.7)
+    ax.scatter(years, y_positions, s=mpl.rcParams["lines.markersize"]**2,
+               c=colors, edgecolors="k", linewidths=1, zorder=2)
+    for x_pos, y_pos, count in zip(years, y_positions, counts.to_numpy()):
         ax.annotate(f"{x_pos}: {count}", (x_pos+2, y_pos),
                     xytext=(x_pos+10, y_pos if x_pos == 1871 else y_pos+.5),
                     size=7, horizontalalignment="left",
@@ -553,12 +610,19 @@ def fill_axes(
                                      alpha=.4)
     # Add department numbers
     numbers: typing.Dict = {}
-    for _, row in dataframe.iterrows():
+    on_main_map: np.ndarray = (dataframe[COLUMN_AREA] > 1.5 * 10**9).to_numpy()
+    xs, ys = np.array(dataframe["coords"].to_list()).T
+    # Plain text is lighter than an annotation without an arrow. Clip it to
+    # the axes, as annotations outside of the minimap are not drawn either.
+    for code_new, code, x, y, is_large in zip(
+            dataframe[COLUMN_CODE_NEW].to_numpy(),
+            dataframe[COLUMN_CODE].to_numpy(),
+            xs, ys,
+            on_main_map):
         target_axes: mpl.axes.Axes = axes["left"]\
-            if row[COLUMN_AREA] > 1.5 * 10**9 else axes["minimap"]
-        numbers[row[COLUMN_CODE_NEW]] = target_axes.annotate(
-            row[COLUMN_CODE], xy=row["coords"], horizontalalignment="center",
-            size=5)
+            if is_large else axes["minimap"]
+        numbers[code_new] = target_axes.text(
+            x, y, code, horizontalalignment="center", size=5, clip_on=True)
     axes["left"].annotate(90, xy=dataframe.loc[dataframe["code"] == "90",
                                                "coords"].values[0],
                           xytext=(1_100_000, 6_700_000),
@@ -589,7 +653,7 @@ def fill_axes(
 
 
 def main() -> None:
-    gdf: gpd.GeoDataFrame = create_gdf(*fetch_files())
+    gdf: gpd.GeoDataFrame = load_gdf()
     fig, axes = make_figure()
     fill_axes(gdf, fig, axes)
     plt.show()
@@ -11,10 +11,20 @@ to a file.
 import glob
 import datetime
 import itertools
+import re
 import typing
 # Third party
 import ics
 import pypdf
+# Hours an event starts before and ends after midnight of the collection date
+HOURS_BEFORE_MIDNIGHT: int = 4
+HOURS_AFTER_MIDNIGHT: int = 16
+OFFSET_BEFORE: datetime.timedelta =\
+    datetime.timedelta(hours=HOURS_BEFORE_MIDNIGHT)
+OFFSET_AFTER: datetime.timedelta =\
+    datetime.timedelta(hours=HOURS_AFTER_MIDNIGHT)
+# A calendar cell: the day of the week, the day number and the description
+CELL_PATTERN: re.Pattern = re.compile(r"\S+\s+(\d{1,2})\s+(\S+)")
 
 
 def read_document() -> typing.List[typing.Tuple[int, int, int, str]]:
@@ -29,21 +39,29 @@ def read_document() -> typing.List[typing.Tuple[int, int, int, str]]:
     -------
     collection_dates : typing.List[typing.Tuple[int, int, int, str]]
         List of tuples containing year, month, day, and description.
+
+    Raises
+    ------
+    ValueError
+        If a cell does not contain a day, day number and description.
     """
     path: str = glob.glob("data/a*9.pdf")[0]
     try:
-        reader: pypdf.PdfReader = pypdf.PdfReader(path)
+        # Read from the open file so only the objects of the first page are
+        # loaded, instead of reading the whole file into memory
+        with open(path, "rb") as file:
+            reader: pypdf.PdfReader = pypdf.PdfReader(file)
+            front_page: pypdf.PageObject = reader.pages[0]
+            # Extract text preserving horizontal positioning without excess
+            # vertical whitespace (removes blank and "whitespace only" lines)
+            lines: str = front_page.extract_text(
+                extraction_mode="layout", layout_mode_space_vertically=True
+                ).split("\n")
     except FileNotFoundError:
         raise FileNotFoundError("The desired input file was not found")
     except pypdf.errors.PyPdfError:
         raise pypdf.errors.PyPdfError(
             "While reading the PDF file an error occured.")
-    front_page: pypdf.PageObject = reader.pages[0]
-    # Extract text preserving horizontal positioning without excess vertical
-    # whitespace (removes blank and "whitespace only" lines)
-    lines: str = front_page.extract_text(extraction_mode="layout",
-                                         layout_mode_space_vertically=True
-                                         ).split("\n")
     date_column_found: bool = False
     collection_dates: typing.List[typing.Tuple[int, int, int, str]] = []
     current_year: int = int(lines[0].strip())
@@ -52,37 +70,52 @@ def read_document() -> typing.List[typing.Tuple[int, int, int, str]]:
                                  114,  # start of third column
                                  172   # start of fourth column
                                  ]
-    all_months: typing.List = []
+    # Slices of the line for every column, the last one running to the end
+    column_slices: typing.List[slice] = [
+        slice(begin, end)
+        for begin, end in itertools.pairwise([*spacing, None])]
+    # The number of every month in order of appearance in the calendar
+    month_numbers: typing.Dict[str, int] = {}
 
     for line in lines:
+        # Skip blank lines before doing any work on them
+        if not line or line.isspace():
+            continue
+        # Strip the line once for all checks below
+        stripped: str = line.strip()
         # Look for the first month to find the beginning of the calender
-        if line.strip().startswith("Jan"):
+        if stripped.startswith("Jan"):
             date_column_found = True
         # If the table doesn't start in this line go to the next line
         if not date_column_found:
             continue
         # Stop at the line containing the version because it is below the
         # calender section
-        if line.strip().startswith("Ver"):
+        if stripped.startswith("Ver"):
             break
 
-        # Whenever the months are mentioned, repopulate the parts list
-        parts: typing.List[str] = line.strip().split()
+        # Whenever the months are mentioned, look up the month of every column
+        parts: typing.List[str] = stripped.split()
         if len(parts) == 4:
-            all_months.extend((months := parts))
+            for month in parts:
+                month_numbers.setdefault(month, len(month_numbers)+1)
+            column_months: typing.List[int] = [month_numbers[month]
+                                               for month in parts]
             continue
 
         # Loop over the line after it has been divided according to the spacing
         # to extract the dates and descriptions
-        for step, text in enumerate([line[a:b].strip()
-                                     for a, b
-                                     in itertools.pairwise([*spacing, None])]
-                                    ):
+        for step, text in enumerate([line[column].strip()
+                                     for column in column_slices]):
             if not text:  # Skip empty columns
                 continue
-            _, day, description = text.strip().split()
+            match: typing.Optional[re.Match] = CELL_PATTERN.fullmatch(text)
+            if match is None:
+                raise ValueError(f"The cell '{text}' does not contain a day,"
+                                 " day number and description.")
+            day, description = match.groups()
             collection_dates.append((current_year,
-                                     all_months.index(months[step])+1,
+                                     column_months[step],
                                      int(day),
                                      description))
     return collection_dates
@@ -104,18 +137,15 @@ def make_calendar(pickup_dates: typing.List[typing.Tuple[int, int, int, str]]
     calendar : ics.Calendar
         The resulting calendar.
     """
-    HOURS_BEFORE_MIDNIGHT: int = 4
-    HOURS_AFTER_MIDNIGHT: int = 16
     calendar: ics.Calendar = ics.Calendar()
-    for (year, month, day, description) in pickup_dates:
-        event_date: datetime.datetime = datetime.datetime(year, month, day)
-        event: ics.Event = ics.Event()
-        event.begin = event_date -\
-            datetime.timedelta(hours=HOURS_BEFORE_MIDNIGHT)
-        event.end = event_date +\
-            datetime.timedelta(hours=HOURS_AFTER_MIDNIGHT)
-        event.name = description
-        calendar.events.add(event)
+    event_dates: typing.List[typing.Tuple[datetime.datetime, str]] = [
+        (datetime.datetime(year, month, day), description)
+        for (year, month, day, description) in pickup_dates]
+    # Create all events up front and add them to the calendar at once
+    calendar.events.update(ics.Event(name=description,
+                                     begin=event_date - OFFSET_BEFORE,
+                                     end=event_date + OFFSET_AFTER)
+                           for event_date, description in event_dates)
     return calendar
 
 
@@ -132,15 +162,20 @@ def write_calendar(calendar: ics.Calendar) -> None:
     -------
     None.
     """
-    with open("calendar.ics", mode="w", encoding="utf-8") as file:
-        timestamp: str = datetime.datetime.now().strftime("%Y%m%dT%H%M%SZ")
-        crlf: str = "\n"
+    timestamp: str = datetime.datetime.now().strftime("%Y%m%dT%H%M%SZ")
+    crlf: str = "\n"
+
+    def _lines() -> typing.Iterator[str]:
+        """Yield the lines of the calendar with the new CRLF sequences."""
         for line in calendar.serialize_iter():
-            # Replace the current CRLF sequence with a new one
-            file.write(line.replace("\r\n", crlf))
-            # Write the timestamp of creating the event in the event
+            yield line.replace("\r\n", crlf)
+            # Add the timestamp of creating the event in the event
             if line.startswith("BEGIN:VEVENT"):
-                file.write(f"DTSTAMP:{timestamp}{crlf}")
+                yield f"DTSTAMP:{timestamp}{crlf}"
+
+    # Stream the lines to the file instead of building the full string
+    with open("calendar.ics", mode="w", encoding="utf-8") as file:
+        file.writelines(_lines())
 
 
 def main() -> None:
@@ -17,6 +17,25 @@ import typing
 # Third party
 import ics
 import pypdf
+# Hours an event starts before and ends after midnight of the collection date
+HOURS_BEFORE_MIDNIGHT: int = 4
+HOURS_AFTER_MIDNIGHT: int = 16
+OFFSET_BEFORE: datetime.timedelta =\
+    datetime.timedelta(hours=HOURS_BEFORE_MIDNIGHT)
+OFFSET_AFTER: datetime.timedelta =\
+    datetime.timedelta(hours=HOURS_AFTER_MIDNIGHT)
+# The month names in English and Dutch, and the Dutch abbreviation of March
+MONTH_NAMES: typing.Tuple[str, ...] = (
+    "january", "february", "march", "april", "may", "june", "july", "august",
+    "september", "october", "november", "december",
+    "januari", "februari", "maart", "april", "mei", "juni", "juli", "augustus",
+    "september", "oktober", "november", "december", "mrt")
+# The first three letters of the month names, to recognise the header lines of
+# the calendar
+MONTH_PREFIXES: typing.FrozenSet[str] = frozenset(
+    name[:3] for name in MONTH_NAMES)
+# A word of three or more lowercase letters, which starts a column
+COLUMN_PATTERN: re.Pattern = re.compile(r"\b[a-z]{3,}\b")
 
 
 def read_document() -> typing.List[typing.Tuple[int, int, int, str]]:
@@ -31,57 +50,79 @@ def read_document() -> typing.List[typing.Tuple[int, int, int, str]]:
     -------
     collection_dates : List of tuples containing year, month, day, and
     description.
+
+    Raises
+    ------
+    ValueError : If no header with the months precedes the dates.
     """
     path: str = glob.glob(r"data/a*[0-9].pdf")[0]
     try:
-        reader: pypdf.PdfReader = pypdf.PdfReader(path)
+        # Read from the open file so only the objects of the first page are
+        # loaded, instead of reading the whole file into memory
+        with open(path, "rb") as file:
+            reader: pypdf.PdfReader = pypdf.PdfReader(file)
+            front_page: pypdf.PageObject = reader.pages[0]
+            # Extract text preserving horizontal positioning without excess
+            # vertical whitespace (removes blank and "whitespace only" lines)
+            lines: str = front_page.extract_text(
+                extraction_mode="layout", layout_mode_space_vertically=True
+                ).split("\n")
     except FileNotFoundError:
         raise FileNotFoundError("The desired input file was not found")
     except pypdf.errors.PyPdfError:
         raise pypdf.errors.PyPdfError(
             "An error occurred while reading the PDF file.")
-    front_page: pypdf.PageObject = reader.pages[0]
-    # Extract text preserving horizontal positioning without excess vertical
-    # whitespace (removes blank and "whitespace only" lines)
-    lines: str = front_page.extract_text(extraction_mode="layout",
-                                         layout_mode_space_vertically=True
-                                         ).split("\n")
     date_column_found: bool = False
     collection_dates: typing.List[typing.Tuple[int, int, int, str]] = []
     current_year: int = int(lines[0].strip())
-    all_months: typing.List = []
+    # The number of every month in order of appearance in the calendar
+    month_numbers: typing.Dict[str, int] = {}
+    # The month of every column, known once a header line has been read
+    column_months: typing.Optional[typing.List[int]] = None
 
     spacing = _determine_spacing(lines)
+    # Slices of the line for every column, the last one running to the end
+    column_slices: typing.List[slice] = [
+        slice(a, b) for a, b in itertools.pairwise([*spacing, None])]
 
     for line in lines:
+        # Skip blank lines before doing any work on them
+        if not line or line.isspace():
+            continue
+        # Strip the line once for all checks below
+        stripped: str = line.strip()
         # Look for the first month to find the beginning of the calender
-        if line.strip().startswith("Jan"):
+        if stripped.startswith("Jan"):
             date_column_found = True
         # If the table doesn't start in this line go to the next line
         if not date_column_found:
             continue
         # Stop at the line containing the version because it is below the
         # calender section
-        if line.strip().startswith("Ver"):
+        if stripped.startswith("Ver"):
             break
 
-        # Whenever the months are mentioned, repopulate the parts list
-        parts: typing.List[str] = line.strip().split()
-        if len(parts) == 4:
-            all_months.extend((months := parts))
+        # Whenever the months are mentioned, look up the month of every column
+        parts: typing.List[str] = stripped.split()
+        if len(parts) == 4 and all(part[:3].lower() in MONTH_PREFIXES
+                                   for part in parts):
+            for month in parts:
+                month_numbers.setdefault(month, len(month_numbers)+1)
+            column_months = [month_numbers[month] for month in parts]
             continue
+        if column_months is None:
+            raise ValueError(
+                f"No header with the months was found before line: {line}")
 
         # Loop over the line after it has been divided according to the spacing
         # to extract the dates and descriptions
-        for step, text in enumerate([line[a:b].strip()
-                                     for a, b
-                                     in itertools.pairwise([*spacing, None])]
-                                    ):
+        for step, text in enumerate([line[column].strip()
+                                     for column in column_slices]):
             if not text:  # Skip empty columns
                 continue
-            _, day, *_, description = text.strip().split()
+            _, day, *_, description = text.split()
             collection_dates.append((current_year,
-                                     all_months.index(months[step])+1,
+                                     column_months[step],
                                      int(day),
                                      description))
     return collection_dates
@@ -103,11 +144,13 @@ def _determine_spacing(lines: typing.List[str]) -> typing.List[int]:
         spacing : A sorted list of the starting positions of the four most
         common words.
     """
-    matches: collections.Counter = collections.Counter([
-                            match.start()
-                            for line in lines
-                            for match in re.finditer(r"\b[a-z]{3,}\b", line)])
-    spacing: list[int] = sorted([val[0] for val in matches.most_common(4)])
+    # Scan all lines at once and convert every match to its position within
+    # its own line
+    text: str = "\n".join(lines)
+    matches: collections.Counter = collections.Counter(
+        match.start() - text.rfind("\n", 0, match.start()) - 1
+        for match in COLUMN_PATTERN.finditer(text))
+    spacing: list[int] = sorted(val[0] for val in matches.most_common(4))
     return spacing
 
 
@@ -125,16 +168,12 @@ def make_calendar(pickup_dates: typing.List[typing.Tuple[int, int, int, str]]
     -------
     calendar : The resulting calendar.
     """
-    HOURS_BEFORE_MIDNIGHT: int = 4
-    HOURS_AFTER_MIDNIGHT: int = 16
     calendar: ics.Calendar = ics.Calendar()
     for (year, month, day, description) in pickup_dates:
         event_date: datetime.datetime = datetime.datetime(year, month, day)
         event: ics.Event = ics.Event()
-        event.begin = event_date -\
-            datetime.timedelta(hours=HOURS_BEFORE_MIDNIGHT)
-        event.end = event_date +\
-            datetime.timedelta(hours=HOURS_AFTER_MIDNIGHT)
+        event.begin = event_date - OFFSET_BEFORE
+        event.end = event_date + OFFSET_AFTER
         event.name = description
         calendar.events.add(event)
     return calendar
@@ -152,15 +191,20 @@ def write_calendar(calendar: ics.Calendar) -> None:
     -------
     None.
     """
-    with open("calendar.ics", mode="w", encoding="utf-8") as file:
-        timestamp: str = datetime.datetime.now().strftime("%Y%m%dT%H%M%SZ")
-        crlf: str = "\n"
+    timestamp: str = datetime.datetime.now().strftime("%Y%m%dT%H%M%SZ")
+    crlf: str = "\n"
+
+    def _lines() -> typing.Iterator[str]:
+        """Yield the lines of the calendar with the new CRLF sequences."""
         for line in calendar.serialize_iter():
-            # Replace the current CRLF sequence with a new one
-            file.write(line.replace("\r\n", crlf))
-            # Write the timestamp of creating the event in the event
+            yield line.replace("\r\n", crlf)
+            # Add the timestamp of creating the event in the event
             if line.startswith("BEGIN:VEVENT"):
-                file.write(f"DTSTAMP:{timestamp}{crlf}")
+                yield f"DTSTAMP:{timestamp}{crlf}"
+
+    # Stream the lines to the file instead of building the full string
+    with open("calendar.ics", mode="w", encoding="utf-8") as file:
+        file.writelines(_lines())
 
 
 def main() -> None:
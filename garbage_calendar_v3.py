@@ -12,6 +12,7 @@ import argparse
 import collections
 import glob
 import datetime
+import functools
 import itertools
 import logging
 import os
@@ -23,8 +24,27 @@ import pypdf
 # Constants
 HOURS_BEFORE_MIDNIGHT: int = 4
 HOURS_AFTER_MIDNIGHT: int = 16
+OFFSET_BEFORE: datetime.timedelta =\
+    datetime.timedelta(hours=HOURS_BEFORE_MIDNIGHT)
+OFFSET_AFTER: datetime.timedelta =\
+    datetime.timedelta(hours=HOURS_AFTER_MIDNIGHT)
 CRLF: str = "\n"
 FILENAME: str = "calendar.ics"
+# A word of two or more lowercase letters before a digit on the same line,
+# which starts a column
+COLUMN_PATTERN: re.Pattern = re.compile(r"\b[a-z]{2,}\b[^\S\n]+\d")
+# The month names in English and Dutch, and the Dutch abbreviation of March
+MONTH_NAMES: typing.Tuple[str, ...] = (
+    "january", "february", "march", "april", "may", "june", "july", "august",
+    "september", "october", "november", "december",
+    "januari", "februari", "maart", "april", "mei", "juni", "juli", "augustus",
+    "september", "oktober", "november", "december", "mrt")
+# The first three letters of the month names, to recognise the header lines of
+# the calendar
+MONTH_PREFIXES: typing.FrozenSet[str] = frozenset(
+    name[:3] for name in MONTH_NAMES)
+# The year of the calendar, the first number in the 2000s
+YEAR_PATTERN: re.Pattern = re.compile(r"2\d{3}")
 logger: logging.Logger = logging.getLogger(__name__)
 
 
@@ -83,15 +103,43 @@ def _determine_spacing(lines: typing.List[str]) -> typing.List[int]:
         spacing : A sorted list of the starting positions of the four most
         common words.
     """
-    matches: collections.Counter = collections.Counter([
-        match.start() for line in lines
-        for match in re.finditer(r"\b[a-z]{2,}\b\s+\d", line)])
+    # Scan all lines at once and convert every match to its position within
+    # its own line
+    text: str = "\n".join(lines)
+    matches: collections.Counter = collections.Counter(
+        match.start() - text.rfind("\n", 0, match.start()) - 1
+        for match in COLUMN_PATTERN.finditer(text))
     spacing: typing.List[int] = sorted(val[0]
                                        for val in matches.most_common(4))
     logger.debug(f"Determined spacing: {spacing}")
     return spacing
 
 
+@functools.lru_cache(maxsize=4)
+def _extract_text(path: str, modified: float) -> str:
+    """
+    Extracts the text of the first page of a PDF file. The result is cached,
+    so reading the same unchanged file again skips parsing the PDF.
+
+    Parameters:
+        path : The path to the PDF file.
+        modified : The modification time of the file, part of the cache key.
+
+    Returns:
+        The text of the first page with its layout preserved.
+    """
+    # Read from the open file so only the objects of the first page are
+    # loaded, instead of reading the whole file into memory
+    with open(path, "rb") as file:
+        reader: pypdf.PdfReader = pypdf.PdfReader(file)
+        front_page: pypdf.PageObject = reader.pages[0]
+        logger.debug("The first page was loaded.")
+        # Extract text preserving horizontal positioning without excess
+        # vertical whitespace (removes blank and "whitespace only" lines)
+        return front_page.extract_text(
+            extraction_mode="layout", layout_mode_space_vertically=True)
+
+
 def read_document(path: str) -> typing.List[typing.Tuple[int, int, int, str]]:
     """
     Extracts dates and descriptions from a PDF file to a list of dates.
@@ -105,84 +153,102 @@ def read_document(path: str) -> typing.List[typing.Tuple[int, int, int, str]]:
 
     Raises:
         pypdf.errors.PyPdfError: If an error occurs while reading the PDF file.
-        ValueError: If the PDF does not contain valid dates.
+        ValueError: If the PDF does not contain valid dates or no header with
+            the months precedes them.
     """
     try:
-        reader: pypdf.PdfReader = pypdf.PdfReader(path)
-        logger.debug(f"{reader.get_num_pages()} page was loaded.")
+        # Pass the modification time along so a changed file is read again
+        text: str = _extract_text(path, os.path.getmtime(path))
     except pypdf.errors.PyPdfError:
         raise pypdf.errors.PyPdfError(
             "An error occurred while reading the PDF file.")
-    front_page: pypdf.PageObject = reader.pages[0]
-    # Extract text preserving horizontal positioning without excess vertical
-    # whitespace (removes blank and "whitespace only" lines)
-    text: str = front_page.extract_text(extraction_mode="layout",
-                                        layout_mode_space_vertically=True
-                                        )
     if not text.strip():
         raise ValueError(
             "The PDF file is empty or does not contain valid text.")
-    year: int = int(re.findall(r"2\d{3}", text)[0])
+    year_match: typing.Optional[re.Match] = YEAR_PATTERN.search(text)
+    if year_match is None:
+        raise ValueError("The PDF file does not contain a year.")
+    year: int = int(year_match.group())
     logger.debug(f"The extracted year is: {year}.")
     lines: typing.List[str] = text.split("\n")
     date_column_found: bool = False
     collection_dates: typing.List[typing.Tuple[int, int, int, str]] = []
-    all_months: typing.List[str] = []
+    # The number of every month in order of appearance in the calendar
+    month_numbers: typing.Dict[str, int] = {}
+    # The month of every column, known once a header line has been read
+    column_months: typing.Optional[typing.List[int]] = None
 
     for index, line in enumerate(lines):
-        # Skip empty lines
-        if not line:
+        # Skip empty and whitespace only lines
+        if not line or line.isspace():
             logger.info(f"Skipped line {index}")
             continue
+        # Strip the line once for all checks below
+        stripped: str = line.strip()
+        lowered: str = stripped.lower()
         # Look for the first month to find the beginning of the calender
-        if line.strip().lower().startswith("jan"):
+        if lowered.startswith("jan"):
             date_column_found = True
             logger.debug(f"Date column found on line {index}")
             spacing = _determine_spacing(lines[index:])
+            # Slices of the line for every column, the last one running to
+            # the end
+            column_slices: typing.List[slice] = [
+                slice(begin, end)
+                for begin, end in itertools.pairwise([*spacing, None])]
         # If the table doesn't start in this line go to the next line
         if not date_column_found:
             continue
         # Stop at the line containing the version because it is below the
         # calender section
-        if line.strip().lower().startswith("ver"):
+        if lowered.startswith("ver"):
             logger.info(f"End found on line {index}: {line}")
             break
 
-        # Whenever the months are mentioned, repopulate the parts list
-        parts: typing.List[str] = line.strip().split()
-        if len(parts) == 4:
-            all_months.extend((months := parts))
+        # Whenever the months are mentioned, look up the month of every column
+        parts: typing.List[str] = stripped.split()
+        if len(parts) == 4 and all(part[:3].lower() in MONTH_PREFIXES
+                                   for part in parts):
+            for month in parts:
+                month_numbers.setdefault(month, len(month_numbers)+1)
+            column_months = [month_numbers[month] for month in parts]
             continue
+        if column_months is None:
+            raise ValueError(
+                f"No header with the months was found before line: {line}")
 
         logger.debug(f"Processing line {index}: {line}")
         # Loop over the line after it has been divided according to the spacing
         # to extract the dates and descriptions
-        for step, text in enumerate([line[begin:end].strip() for begin, end
-                                     in itertools.pairwise([*spacing, None])]
-                                    ):
+        for step, text in enumerate([line[column].strip()
+                                     for column in column_slices]):
             if not text:  # Skip empty columns
                 continue
             logger.debug(f"Extracted text from line {index}: {text}")
             try:
-                _, day, description = text.strip().split()
+                _, day, description = text.split()
             except ValueError as exc:
                 logger.warning(
                     f"The string '{text}' did not contain three elements.")
                 if str(exc) == (
                         "not enough values to unpack (expected 3, got 1)"):
-                    description = text.strip().split()[0]
+                    description = text.split()[0]
                     for event in collection_dates[::-1]:
                         # Find the last added event in the same month i.e. the
                         # same day
-                        if event[1] == all_months.index(months[step])+1:
+                        if event[1] == column_months[step]:
                             day = event[2]  # Take the day number
                             break
+                    else:
+                        raise ValueError(
+                            f"No earlier date found in the month of '{text}'."
+                            ) from exc
                 else:
                     raise exc
             logger.debug((f"Extracted information from line {index}:"
                           f" {year} {step} {day} {description}"))
             collection_dates.append((year,
-                                     all_months.index(months[step])+1,
+                                     column_months[step],
                                      int(day),
                                      description))
     if not collection_dates:
@@ -209,8 +275,8 @@ def make_calendar(pickup_dates: typing.List[typing.Tuple[int, int, int, str]]
         event_date: datetime.datetime = datetime.datetime(year, month, day)
         event: ics.Event = ics.Event(
             name=description,
-            begin=event_date - datetime.timedelta(hours=HOURS_BEFORE_MIDNIGHT),
-            end=event_date + datetime.timedelta(hours=HOURS_AFTER_MIDNIGHT),
+            begin=event_date - OFFSET_BEFORE,
+            end=event_date + OFFSET_AFTER,
             uid=f"UnicornOnAzur@{year}_{month}_{day}_{description}"
             )
         calendar.events.add(event)
@@ -230,15 +296,19 @@ def write_calendar(calendar: ics.Calendar) -> None:
         None.
     """
     timestamp: str = datetime.datetime.now().strftime("%Y%m%dT%H%M%SZ")
-    with open(FILENAME, mode="w", encoding="utf-8") as file:
+
+    def _lines() -> typing.Iterator[str]:
+        """Yield the lines of the calendar with the new CRLF sequences."""
         for line in calendar.serialize_iter():
-            # Replace the current CRLF sequence with a new one
-            file.write(line.replace("\r\n", CRLF))
-            # Write the timestamp of creating the event in the event
+            yield line.replace("\r\n", CRLF)
+            # Add the timestamp of creating the event in the event
             if line.startswith("BEGIN:VEVENT"):
-                file.write(f"DTSTAMP:{timestamp}{CRLF}")
-        else:
-            logger.info("All events were written to the file.")
+                yield f"DTSTAMP:{timestamp}{CRLF}"
+
+    # Stream the lines to the file instead of building the full string
+    with open(FILENAME, mode="w", encoding="utf-8") as file:
+        file.writelines(_lines())
+    logger.info("All events were written to the file.")
     if glob.glob(FILENAME):  # Verify if the file is created
         logger.info("File was created successfully.")
 
@@ -6,19 +6,45 @@ It allows users to upload GPX files, extract their coordinates, and visualize
 the tracks on an interactive map.
 """
 #  Standard library
+import concurrent.futures
+import itertools
 import typing
 # Third party
 import folium
 import geopandas as gpd
 import matplotlib as mpl
-import pandas as pd
+import numpy as np
+import shapely
 import streamlit as st
 import streamlit.components.v1 as components
 # Constants
 UPLOADED_FILE: typing.TypeAlias =\
     typing.Optional[typing.List[st.runtime.uploaded_file_manager.UploadedFile]]
+# The colors of the tracks, which are repeated when there are more tracks
+COLORMAP: typing.List[str] = list(map(mpl.colors.to_hex,
+                                      mpl.colormaps["Set1"].colors))
 
 
+def _read_tracks(
+    file_name: st.runtime.uploaded_file_manager.UploadedFile
+        ) -> gpd.GeoDataFrame:
+    """
+    Reads only the geometries of the "tracks" layer of a GPX file into a
+    GeoDataFrame with pyogrio's bulk reader, transferring the data as Arrow.
+    This is not cached itself, as it runs in worker threads without the
+    Streamlit script context; the map built from it is cached instead.
+
+    Parameters:
+        file_name : The GPX file to read.
+
+    Returns:
+        A GeoDataFrame with the tracks.
+    """
+    return gpd.read_file(file_name, layer="tracks", columns=[],
+                         engine="pyogrio", use_arrow=True)
+
+
+@st.cache_data(show_spinner=False)
 def make_map(
     file_list: UPLOADED_FILE
         ) -> str:
@@ -27,7 +53,8 @@ def make_map(
 
     This function reads GPX files, extracts their coordinates, and creates a
     map with polylines representing the tracks that is fitted to the extent of
-    the tracks.
+    the tracks. The rendered map is cached on the names and contents of the
+    files, so reruns of the app with the same uploads skip rendering.
 
     Parameters:
         file_list : An optional list of GPX files to be plotted on the map.
@@ -35,23 +62,30 @@ def make_map(
     Returns:
         The rendered HTML representation of the folium map.
     """
-    colormap: typing.List[str] = list(map(mpl.colors.to_hex,
-                                          mpl.colormaps["Set1"].colors))
     map_: folium.Map = folium.Map()
-    gdfs: typing.List[gpd.GeoDataFrame] = []
-    for file_name, color in zip(file_list, colormap):
-        # Read the GPX file into a GeoDataFrame from the "tracks" layer and add
-        # it to the list.
-        gdf: gpd.GeoDataFrame = gpd.read_file(file_name, layer="tracks")
-        gdfs.append(gdf)
+    # The bounds of all tracks as minimum x and y, and maximum x and y
+    bounds: np.ndarray = np.array([np.inf, np.inf, -np.inf, -np.inf])
+    # Read the files concurrently, as GDAL releases the GIL while reading
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(8, len(file_list)))) as executor:
+        gdfs: typing.Iterator[gpd.GeoDataFrame] =\
+            executor.map(_read_tracks, file_list)
+    for file_name, color, gdf in zip(file_list, itertools.cycle(COLORMAP),
+                                     gdfs):
+        # Extend the bounds with the tracks of this file
+        track_bounds: np.ndarray = gdf.total_bounds
+        bounds[:2] = np.fmin(bounds[:2], track_bounds[:2])
+        bounds[2:] = np.fmax(bounds[2:], track_bounds[2:])
         #  Create a FeatureGroup for the current file to hold its polyline and
         # add that to the map
         lines_layer: folium.FeatureGroup = folium.FeatureGroup(name=file_name)
-        folium.PolyLine(locations=gdf.geometry.get_coordinates()[["y", "x"]],
-                        color=color).add_to(lines_layer)
+        # Take the coordinates as an array and swap them to latitude first
+        locations: typing.List[typing.List[float]] = shapely.get_coordinates(
+            gdf.geometry.values)[:, ::-1].tolist()
+        folium.PolyLine(locations=locations, color=color).add_to(lines_layer)
         lines_layer.add_to(map_)
     # Fit the extent of the map to the tracks
-    xmin, ymin, xmax, ymax = pd.concat(gdfs).total_bounds if gdfs\
+    xmin, ymin, xmax, ymax = bounds if np.isfinite(bounds).all()\
         else [-50, -50, 50, 50]
     map_.fit_bounds([[ymin, xmin], [ymax, xmax]])
     return folium.Figure().add_child(map_).render()
@@ -7,11 +7,14 @@ enumerate, and map. It provides various examples of how these functions can
 be utilized to manipulate iterators and visualize data using matplotlib.
 """
 # Standard library
+import os
 import typing
 # Third party
 import matplotlib.pyplot as plt
 # Matplotlib settings
 plt.rcParams["axes.titlesize"] = 7
+# Constants
+OUTPUT_FILENAME: str = "output/demo.png"
 
 
 def _stringify_iterator(
@@ -120,16 +123,23 @@ def matrix_transposing() -> None:
     print(_stringify_iterator("zip(*matrix):", zip(*matrix)))
 
 
-def plot() -> None:
+def plot(
+    skip_if_up_to_date: bool = False
+        ) -> None:
     """
     Creates a plot demonstrating different inputs using matplotlib.
 
     Parameters:
-        None
+        skip_if_up_to_date : Skip rendering when the saved plot is newer than
+            this script. Only the script is checked, so a change in e.g. the
+            matplotlib version or style is not picked up.
 
     Returns:
         None
     """
+    if (skip_if_up_to_date and os.path.isfile(OUTPUT_FILENAME) and
+            os.path.getmtime(OUTPUT_FILENAME) > os.path.getmtime(__file__)):
+        return
     fig, axes = plt.subplots(ncols=4, figsize=(7, 4),
                              subplot_kw={'xticks': [], 'yticks': []})
     fig.subplots_adjust(wspace=.2, left=.01, right=.99, bottom=.01)
@@ -144,7 +154,7 @@ def plot() -> None:
     axes[2].plot(*list(zip(*sizes)))
     axes[3].set_title("Separate lists")
     axes[3].plot(size_d, size_c)
-    fig.savefig("output/demo.png")
+    fig.savefig(OUTPUT_FILENAME)
 
 
 def demo() -> None:
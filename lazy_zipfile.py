@@ -10,6 +10,8 @@ only when requested, rather than loading everything into memory at once.
 import typing
 import warnings
 import zipfile
+# The number of bytes read from a file in the ZIP file at a time (1 MiB)
+CHUNK_SIZE: int = 1024 ** 2
 
 
 def lazy_read_zip_file_contents(path: str
@@ -20,11 +22,12 @@ def lazy_read_zip_file_contents(path: str
     """
     Reads the contents of a ZIP file lazily by returning a dictionary
     comprehension where all the file names are mapped to a generator that
-    yields the bytes content. The content can be retrieved by calling the
-    generator.
+    yields the bytes content in chunks of CHUNK_SIZE. The content can be
+    retrieved by iterating over the generator, so at most one chunk has to be
+    in memory at a time.
 
     >>> zp_dict = lazy_read_zip_file_contents("file.zip")
-    >>> file_contents = next(zp_dict[filename])
+    >>> file_contents = b"".join(zp_dict[filename])
 
     Parameters
     ----------
@@ -34,15 +37,16 @@ def lazy_read_zip_file_contents(path: str
     Returns
     ------
     typing.Dict[str, typing.Generator[bytes, None, None]]:
-        A dictionary with file names as keys and generators with the content as
-        values.
+        A dictionary with file names as keys and generators with the chunks of
+        the content as values.
 
     """
     def _read_file_contents(filename: str) -> typing.Generator[bytes,
                                                                None,
                                                                None]:
         """
-        Reads the contents of a specific file within the ZIP file.
+        Reads the contents of a specific file within the ZIP file chunk by
+        chunk.
 
         Parameters
         ----------
@@ -52,20 +56,25 @@ def lazy_read_zip_file_contents(path: str
         Yields
         ------
         typing.Generator[bytes, None, None]
-            The contents of the file.
+            The next chunk of the contents of the file.
 
         """
-        with zipfile.ZipFile(path, allowZip64=True) as zf:
-            yield zf.read(filename)
+        # Every generator opens its own handle, which is closed as soon as
+        # the file has been read
+        with zipfile.ZipFile(path, allowZip64=True) as zip_file:
+            with zip_file.open(filename) as file:
+                while chunk := file.read(CHUNK_SIZE):
+                    yield chunk
 
     try:
         with zipfile.ZipFile(path, allowZip64=True) as zip_file:
-            return {file_name: _read_file_contents(file_name)
-                    for file_name in zip_file.namelist()}
+            file_names: typing.List[str] = zip_file.namelist()
     # Handle the case where the ZIP file is invalid
     except (zipfile.BadZipFile, PermissionError) as exception:
         warnings.warn(f"{exception}: {path}")
         return {}
+    return {file_name: _read_file_contents(file_name)
+            for file_name in file_names}
 
 
 def demo(depth: int = 3):
@@ -103,7 +112,7 @@ def demo(depth: int = 3):
         content_size: typing.List = []
         for key in dic:
             try:
-                content_size.append(sys.getsizeof(next(dic[key])))
+                content_size.append(sum(map(sys.getsizeof, dic[key])))
             except RuntimeError as e:
                 print(e)
 
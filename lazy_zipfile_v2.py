@@ -7,7 +7,7 @@ memory-efficient handling of potentially large files by yielding their contents
 only when requested, rather than loading everything into memory at once.
 """
 # Standard library
-import itertools
+import functools
 import typing
 import warnings
 import zipfile
@@ -17,34 +17,35 @@ class LazyZIPdict(dict):
     """
     A dictionary subclass that lazily retrieves values from a zip object.
 
-    This class overrides the __getitem__ method to return the next item from
-    the iterator of the value associated with the given key. If the value is
-    not an iterator, it raises a TypeError.
+    This class overrides the __getitem__ method to return the result of
+    calling the reader associated with the given key. If the value is not
+    callable, it raises a TypeError.
     """
 
     def __getitem__(self, key: str) -> bytes:
         """
-        Retrieve the next item from the iterator associated with the given key.
+        Retrieve the content by calling the reader associated with the given
+        key.
 
         Parameters
         ----------
         key : str
-            The key for which to retrieve the next item.
+            The key for which to retrieve the content.
 
         Returns
         -------
         bytes
-            The next item from the iterator.
+            The content read from the ZIP file.
 
         Raises
         ------
         TypeError
-            If the value for the key is not iterable.
+            If the value for the key is not callable.
         """
-        value: typing.Generator[bytes, None, None] = super().__getitem__(key)
-        if not hasattr(value, '__iter__'):
-            raise TypeError(f"The value for key '{key}' is not iterable.")
-        return next(value)
+        value: typing.Callable[[], bytes] = super().__getitem__(key)
+        if not callable(value):
+            raise TypeError(f"The value for key '{key}' is not callable.")
+        return value()
 
     def contents(self):
         """
@@ -61,13 +62,34 @@ class LazyZIPdict(dict):
         print("\n".join(sorted(self.keys())))
 
 
+def _read_file_contents(path: str,
+                        file_name: str
+                        ) -> bytes:
+    """
+    Reads the contents of a specific file within the ZIP file.
+
+    Parameters
+    ----------
+    path : str
+        The path to the ZIP file.
+    file_name : str
+        The name of the file in the ZIP file to read.
+
+    Returns
+    -------
+    bytes
+        The contents of the file.
+    """
+    with zipfile.ZipFile(path, "r", allowZip64=True) as zip_file:
+        return zip_file.read(file_name)
+
+
 def lazy_read_zip_file_contents(path: str
                                 ) -> LazyZIPdict:
     """
     Reads the contents of a ZIP file lazily by returning a dictionary
-    comprehension where all the file names are mapped to a generator that
-    yields the bytes content. The content can be retrieved by calling the
-    generator.
+    comprehension where all the file names are mapped to a reader of the bytes
+    content. Nothing is read until the content of a file is requested.
 
     >>> zp_dict = lazy_read_zip_file_contents("file.zip")
     >>> file_contents = zp_dict[filename]
@@ -90,11 +112,8 @@ def lazy_read_zip_file_contents(path: str
     """
     try:
         with zipfile.ZipFile(path, "r", allowZip64=True) as zip_file:
-            return LazyZIPdict({file_name: (file
-                                            for file
-                                            in itertools.repeat(
-                                                zip_file.read(file_name))
-                                            )
+            return LazyZIPdict({file_name: functools.partial(
+                                    _read_file_contents, path, file_name)
                                 for file_name in zip_file.namelist()})
     # Handle the case where the ZIP file is invalid
     except (zipfile.BadZipFile, PermissionError) as exception:
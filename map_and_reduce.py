@@ -12,7 +12,8 @@ import typing
 
 def map_and_reduce(
     initial_values: typing.Any,
-    functions: typing.Iterable[typing.Callable[[typing.Any], typing.Any]]
+    functions: typing.Iterable[typing.Callable[[typing.Any], typing.Any]],
+    vectorized: bool = False
         ) -> typing.List[typing.Any]:
     """
     Applies a list of functions to each element of an iterable and reduces the
@@ -21,6 +22,10 @@ def map_and_reduce(
     Parameters:
         initial_value : An iterable containing the initial values.
         functions : A list of functions to apply.
+        vectorized : Whether to apply every function once to all values as a
+            NumPy array instead of to each value separately. Only use this for
+            elementwise functions, such as ufuncs and arithmetic. Requires
+            NumPy.
 
     Returns:
         A list of results after applying the functions and reducing them.
@@ -51,6 +56,13 @@ def map_and_reduce(
     # Ensure initial_value is iterable
     if not isinstance(initial_values, typing.Iterable):
         raise TypeError("initial_value must be an iterable (list or tuple)")
+    # Let NumPy loop over the values instead of the interpreter
+    if vectorized:
+        import numpy as np  # Only needed for the vectorized path
+        result: typing.Any = _reduce_function(np.asarray(initial_values),
+                                              functions)
+        # The last function may return a scalar or a list instead of an array
+        return np.asarray(result).tolist()
 
     partial_function: typing.Callable = functools.partial(
         _reduce_function,
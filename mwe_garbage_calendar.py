@@ -11,15 +11,20 @@ pickup_dates: list[tuple[int, int, int, str]] = ...
 
 HOURS_BEFORE_MIDNIGHT: int = 4
 HOURS_AFTER_MIDNIGHT: int = 16
+OFFSET_BEFORE: datetime.timedelta =\
+    datetime.timedelta(hours=HOURS_BEFORE_MIDNIGHT)
+OFFSET_AFTER: datetime.timedelta =\
+    datetime.timedelta(hours=HOURS_AFTER_MIDNIGHT)
 calendar: ics.Calendar = ics.Calendar()
-for (year, month, day, description) in pickup_dates:
-    event_date: datetime.datetime = datetime.datetime(year, month, day)
-    event: ics.Event = ics.Event()
-    event.begin: datetime.datetime =\
-        event_date - datetime.timedelta(hours=HOURS_BEFORE_MIDNIGHT)
-    event.end: datetime.datetime =\
-        event_date + datetime.timedelta(hours=HOURS_AFTER_MIDNIGHT)
-    event.name: str = description
-    calendar.events.add(event)
+event_dates: list[tuple[datetime.datetime, str]] = [
+    (datetime.datetime(year, month, day), description)
+    for (year, month, day, description) in pickup_dates]
+# Create all events up front and add them to the calendar at once
+calendar.events.update(ics.Event(name=description,
+                                 begin=event_date - OFFSET_BEFORE,
+                                 end=event_date + OFFSET_AFTER)
+                       for event_date, description in event_dates)
 with open("calendar.ics", mode="w", encoding="utf-8") as my_file:
-    my_file.write(calendar.serialize().replace("\n", ""))
+    # Stream the calendar line by line instead of building the full string
+    my_file.writelines(line.replace("\n", "")
+                       for line in calendar.serialize_iter())
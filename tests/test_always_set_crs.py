@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+author: UnicornOnAzur
+
+Tests for the CRS transformations of always_set_crs.
+"""
+# Standard library
+import typing
+# Third party
+import geopandas as gpd
+import numpy as np
+import pyproj
+import pytest
+import shapely
+# Local imports
+import always_set_crs
+
+
+def test_to_crs_cached_keeps_z() -> None:
+    """Geometries with and without a z coordinate match GeoPandas' to_crs."""
+    gdf: gpd.GeoDataFrame = gpd.GeoDataFrame(
+        geometry=[shapely.Point(5, 52, 10), shapely.Point(5, 52),
+                  shapely.LineString([(5, 52, 1), (6, 53, 2)])],
+        crs=4326)
+    result: gpd.GeoDataFrame = always_set_crs._to_crs_cached(gdf, 28992)
+    expected: gpd.GeoDataFrame = gdf.to_crs(28992)
+    assert result.crs == expected.crs
+    assert result.has_z.tolist() == [True, False, True]
+    assert result.geom_equals_exact(expected, tolerance=1e-6).all()
+
+
+class _FakeCuproj:
+    """
+    Stand-in for cuProj that transforms on the CPU with pyproj, using the
+    axis order of the authority like cuProj does.
+    """
+
+    class Transformer:
+        """Stand-in for cuproj.Transformer."""
+
+        def __init__(self, transformer: pyproj.Transformer) -> None:
+            self._transformer = transformer
+
+        @classmethod
+        def from_crs(cls, source: str, target: str
+                     ) -> "_FakeCuproj.Transformer":
+            """Create the transformer without always_xy."""
+            return cls(pyproj.Transformer.from_crs(source, target))
+
+        def transform(self, first: np.ndarray, second: np.ndarray
+                      ) -> typing.Tuple[np.ndarray, np.ndarray]:
+            """Transform the coordinates in the authority's axis order."""
+            return self._transformer.transform(first, second)
+
+
+class _FakeCupy:
+    """Stand-in for CuPy that keeps the arrays in NumPy."""
+    asarray = staticmethod(np.asarray)
+    asnumpy = staticmethod(np.asarray)
+
+
+@pytest.fixture
+def fake_cuproj(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make the cuProj backend available without a GPU."""
+    monkeypatch.setattr(always_set_crs, "cuproj", _FakeCuproj, raising=False)
+    monkeypatch.setattr(always_set_crs, "cp", _FakeCupy, raising=False)
+
+
+@pytest.mark.parametrize("source, target", [(4326, 32631), (32631, 4326)])
+def test_cuproj_backend_matches_pyproj(
+    fake_cuproj: None,
+    source: int,
+    target: int
+        ) -> None:
+    """The cuProj path swaps the axes of WGS 84 and matches pyproj."""
+    points: gpd.GeoSeries = gpd.GeoSeries(
+        gpd.points_from_xy([3.0, 4.5], [51.0, 52.5]), crs=4326).to_crs(source)
+    gdf: always_set_crs.MyGeoDataFrame = always_set_crs.MyGeoDataFrame(
+        geometry=points)
+    assert gdf._supports_cuproj(target)
+    result: gpd.GeoDataFrame = gdf.always_to_crs(target, "lbyl",
+                                                 inplace=False,
+                                                 backend="cuproj")
+    expected: gpd.GeoDataFrame = gdf.to_crs(target)
+    assert result.crs == expected.crs
+    assert result.geom_equals_exact(expected, tolerance=1e-6).all()
+
+
+def test_cuproj_backend_validates_method(fake_cuproj: None) -> None:
+    """An invalid method is rejected before the cuProj path is taken."""
+    gdf: always_set_crs.MyGeoDataFrame = always_set_crs.MyGeoDataFrame(
+        geometry=gpd.points_from_xy([3.0], [51.0]), crs=4326)
+    with pytest.raises(ValueError, match="Method"):
+        gdf.always_to_crs(32631, "invalid", backend="cuproj")
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+author: UnicornOnAzur
+
+Tests for the charts of easy_plotting_with_altair.
+"""
+# Third party
+import pandas as pd
+import plotly
+# Local imports
+import easy_plotting_with_altair
+
+
+def test_part1_serializes_to_json() -> None:
+    """The layered chart of part1 can be written to a Vega-Lite spec."""
+    gapminder: pd.DataFrame = plotly.data.gapminder()
+    gapminder["year"] = pd.to_datetime(gapminder["year"], format="%Y")
+    chart = easy_plotting_with_altair.part1(gapminder)
+    assert chart.to_json()